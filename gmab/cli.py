@@ -2,6 +2,7 @@
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from rich import box
@@ -9,13 +10,12 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from gmab.commands.spawn import spawn_box
-from gmab.commands.terminate import terminate_box
-from gmab.commands.list import list_boxes, get_detailed_instances
-from gmab.commands.configure import run_configure, print_configs
+# The command modules (and through them the provider SDKs: boto3, ovh, ...) are
+# imported inside each command callback rather than here, so `gmab --help` and
+# error paths only pay for click + stdlib.
 from gmab.utils.config_loader import config_exists, ConfigNotFoundError, load_config
+from gmab.utils.paths import get_config_dir
 from gmab.utils.output import resolve_output_format, emit_json, instance_to_json, OUTPUT_FORMATS
-from gmab.providers import get_available_providers
 from gmab import __version__
 
 
@@ -51,6 +51,11 @@ LIST_COLUMNS = [
     ('image', 'Image', 'flex'),
     ('time_left', 'Time Left', 'fixed'),
 ]
+LIST_COLUMN_HEADERS = {key: header for key, header, _ in LIST_COLUMNS}
+LIST_COLUMN_KINDS = {key: kind for key, _, kind in LIST_COLUMNS}
+# What a cell shows when the instance dict lacks the key.
+LIST_COLUMN_FALLBACKS = {key: 'Unknown' for key, _, _ in LIST_COLUMNS}
+LIST_COLUMN_FALLBACKS['ip'] = 'No IP'
 
 
 def select_list_columns(width):
@@ -89,6 +94,15 @@ def _instance_cell(key, value):
     return Text(value)
 
 
+def _time_left_text(lifetime_left):
+    """Format a lifetime_left value (minutes) for the Time Left column."""
+    if lifetime_left is None:
+        return '?'
+    if lifetime_left < 1:
+        return 'expired'
+    return f"{int(lifetime_left)}m"
+
+
 def render_instances_table(instances):
     """
     Render gmab instances as a responsive rich table that auto-sizes to the
@@ -98,35 +112,25 @@ def render_instances_table(instances):
     console = Console()
     keep = select_list_columns(console.width)
 
-    headers = {key: header for key, header, _ in LIST_COLUMNS}
-    kinds = {key: kind for key, _, kind in LIST_COLUMNS}
-
     table = Table(box=_table_box(), show_lines=True)
     for key in keep:
-        if kinds[key] == 'flex':
-            table.add_column(headers[key], overflow='fold')
+        if LIST_COLUMN_KINDS[key] == 'flex':
+            table.add_column(LIST_COLUMN_HEADERS[key], overflow='fold')
         else:
-            table.add_column(headers[key], no_wrap=True)
+            table.add_column(LIST_COLUMN_HEADERS[key], no_wrap=True)
 
+    # Resolve each kept column's (key, fallback) once rather than per row; rows
+    # then only format the cells that are actually shown.
+    cells = [(key, LIST_COLUMN_FALLBACKS.get(key)) for key in keep]
     for instance in instances:
-        lifetime_left = instance.get('lifetime_left')
-        if lifetime_left is None:
-            time_left = '?'
-        elif lifetime_left < 1:
-            time_left = 'expired'
-        else:
-            time_left = f"{int(lifetime_left)}m"
-        values = {
-            'provider': str(instance.get('provider', 'Unknown')),
-            'instance_id': str(instance.get('instance_id', 'Unknown')),
-            'label': str(instance.get('label', 'Unknown')),
-            'ip': str(instance.get('ip', 'No IP')),
-            'status': str(instance.get('status', 'Unknown')),
-            'region': str(instance.get('region', 'Unknown')),
-            'image': str(instance.get('image', 'Unknown')),
-            'time_left': time_left,
-        }
-        table.add_row(*(_instance_cell(key, values[key]) for key in keep))
+        row = []
+        for key, fallback in cells:
+            if key == 'time_left':
+                value = _time_left_text(instance.get('lifetime_left'))
+            else:
+                value = str(instance.get(key, fallback))
+            row.append(_instance_cell(key, value))
+        table.add_row(*row)
 
     console.print(table)
 
@@ -167,13 +171,14 @@ def _flatten(value, prefix=''):
     return rows
 
 
-def render_instance_detail(inst, raw, extras, verbose):
+def render_instance_detail(inst, raw, extras, verbose, console=None):
     """
     Render one instance as a two-column (Field / Value) table. Non-verbose shows
     a curated set (the common fields plus the provider's detail_extras); verbose
-    dumps the entire provider API payload (flattened).
+    dumps the entire provider API payload (flattened). Pass a shared `console`
+    to batch several instances into one write.
     """
-    console = Console()
+    console = console or Console()
     table_box = _table_box()
     sep = '·' if table_box is box.ROUNDED else '-'  # keep the title ASCII-safe too
     title = f"{inst.get('provider', '?')}  {sep}  {inst.get('label', '?')}"
@@ -208,21 +213,63 @@ def render_instance_detail(inst, raw, extras, verbose):
     console.print(table)
 
 
+class LazyChoice(click.Choice):
+    """
+    A click.Choice whose choices come from a callable, evaluated the first time
+    they're needed (validation, `--help`, completion) rather than when the
+    command is declared. Lets an option offer the provider names without
+    importing every provider SDK whenever the CLI module loads.
+    """
+
+    def __init__(self, get_choices, case_sensitive=True):
+        self._get_choices = get_choices
+        super().__init__((), case_sensitive=case_sensitive)
+        # Choice.__init__ assigned the empty placeholder through the setter;
+        # drop it so the real list is loaded on first access.
+        self._choices = None
+
+    @property
+    def choices(self):
+        if self._choices is None:
+            self._choices = list(self._get_choices())
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = list(value)
+
+
+def _configure_provider_choices():
+    """'all' plus every registered provider, for `configure --provider`."""
+    from gmab.providers import get_available_providers
+    return ['all'] + get_available_providers()
+
+
+# Config directories already seen to hold both config files. Only positive
+# results are remembered: a missing config can be created later in the same
+# process (by `configure`), an existing one isn't removed out from under us.
+_CONFIGURED_DIRS = set()
+
 def check_config_exists():
     """Check if config exists and show an error message if it doesn't."""
+    config_dir = get_config_dir()
+    if config_dir in _CONFIGURED_DIRS:
+        return True
     if not config_exists():
         click.echo("Error: GMAB is not configured.")
         click.echo("Please run 'gmab configure' to set up your configuration.")
         return False
+    _CONFIGURED_DIRS.add(config_dir)
     return True
 
 def get_configured_providers():
-    """Get a list of providers that have been explicitly configured."""
+    """Get the set of providers that have been explicitly configured. Backed by
+    load_config()'s cache, so repeated checks don't re-read providers.json."""
     try:
         providers_config = load_config("providers.json")
-        return list(providers_config.keys())
+        return frozenset(providers_config)
     except (ConfigNotFoundError, Exception):
-        return []
+        return frozenset()
 
 @click.group(invoke_without_command=True)
 @click.version_option(version=__version__, prog_name='gmab',message='%(prog)s %(version)s')
@@ -237,10 +284,12 @@ def cli(ctx):
 @click.option('--region', '-r', default=None, help='Override region (default from config).')
 @click.option('--image', '-i', default=None, help='Override image (default from config).')
 @click.option('--lifetime', '-t', type=int, default=None, help='Lifetime in minutes (default: 60).')
+@click.option('--count', '-n', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Number of instances to spawn (in parallel).')
 @click.option('--output', '-o', type=click.Choice(OUTPUT_FORMATS), default=None,
               help='Output format (default from config, else text).')
-def spawn(provider, region, image, lifetime, output):
-    """ Spawn a new instance. """
+def spawn(provider, region, image, lifetime, count, output):
+    """ Spawn a new instance (or several, with --count). """
     if not check_config_exists():
         return
     fmt = resolve_output_format(output)
@@ -250,7 +299,8 @@ def spawn(provider, region, image, lifetime, output):
             click.echo(f"Please run 'gmab configure -p {provider}' to configure this provider.")
             return
 
-        spawn_box(provider, region, image, lifetime, output=fmt)
+        from gmab.commands.spawn import spawn_box
+        spawn_box(provider, region, image, lifetime, output=fmt, count=count)
     except ConfigNotFoundError:
         click.echo("Error: GMAB is not configured.")
         click.echo("Please run 'gmab configure' to set up your configuration.")
@@ -275,6 +325,9 @@ def terminate(instance_ids, provider, yes, output):
 
     fmt = resolve_output_format(output)
 
+    from gmab.commands.list import list_boxes
+    from gmab.commands.terminate import terminate_box, terminate_boxes
+
     def preview(instances, header):
         """Show what will be terminated before the prompt. Text mode prints the
         rich table to stdout; JSON mode prints a JSON 'plan' to stderr, so stdout
@@ -308,16 +361,28 @@ def terminate(instance_ids, provider, yes, output):
             click.echo(message)
 
     def run(instances):
-        """Terminate instance dicts; return (terminated, failed) result lists."""
-        terminated, failed = [], []
+        """Terminate instance dicts; return (terminated, failed) result lists.
+        Instances are grouped by provider so each provider gets one bulk call."""
+        by_provider = {}
         for inst in instances:
+            by_provider.setdefault(inst['provider'], []).append(inst)
+
+        terminated, failed = [], []
+        for provider_name, group in by_provider.items():
+            ids = [inst['instance_id'] for inst in group]
             try:
-                terminate_box(inst['instance_id'], inst['provider'], quiet=(fmt == 'json'))
-                terminated.append({"provider": inst['provider'],
-                                   "instance_id": inst['instance_id'],
-                                   "label": inst.get('label')})
+                errors = terminate_boxes(ids, provider_name, quiet=(fmt == 'json'))
             except Exception as e:
-                failed.append({"instance_id": inst['instance_id'], "error": str(e)})
+                errors = {instance_id: f"Failed to terminate instance: {str(e)}"
+                          for instance_id in ids}
+            for inst in group:
+                if inst['instance_id'] in errors:
+                    failed.append({"instance_id": inst['instance_id'],
+                                   "error": errors[inst['instance_id']]})
+                else:
+                    terminated.append({"provider": provider_name,
+                                       "instance_id": inst['instance_id'],
+                                       "label": inst.get('label')})
         return terminated, failed
 
     try:
@@ -327,8 +392,10 @@ def terminate(instance_ids, provider, yes, output):
             return
 
         # Handle 'expired'
+        # The Time Left column (and its sort) is only needed for the preview,
+        # which -y skips.
         if len(instance_ids) == 1 and instance_ids[0] == 'expired':
-            instances = list_boxes(provider)
+            instances = list_boxes(provider, compute_lifetime=not yes, for_lookup=True)
             expired_instances = [i for i in instances if i.get('is_expired', False)]
             if not expired_instances:
                 nothing("No expired instances found." if instances else "No active instances found.")
@@ -342,7 +409,7 @@ def terminate(instance_ids, provider, yes, output):
 
         # Handle 'all'
         if len(instance_ids) == 1 and instance_ids[0] == 'all':
-            instances = list_boxes(provider)
+            instances = list_boxes(provider, compute_lifetime=not yes, for_lookup=True)
             if not instances:
                 nothing("No active instances found.")
                 return
@@ -366,7 +433,7 @@ def terminate(instance_ids, provider, yes, output):
             # matches `list`; fall back to a minimal "not found" row for anything
             # we can't look up (terminate_box surfaces the real error on proceed).
             try:
-                known = list_boxes(provider)
+                known = list_boxes(provider, for_lookup=True)
             except Exception:
                 known = []
             by_id = {i['instance_id']: i for i in known}
@@ -385,13 +452,24 @@ def terminate(instance_ids, provider, yes, output):
         if not confirm_or_abort():
             return
 
+        # The (at most 5) ids may live on different providers and each needs its
+        # own lookup + delete round-trip, so overlap them. The workers stay
+        # quiet; confirmations are echoed here, in argument order.
+        with ThreadPoolExecutor(max_workers=len(instance_ids)) as executor:
+            futures = [
+                executor.submit(terminate_box, ident, provider, quiet=True)
+                for ident in instance_ids
+            ]
         terminated, failed = [], []
-        for ident in instance_ids:
+        for ident, future in zip(instance_ids, futures):
             try:
-                terminate_box(ident, provider, quiet=(fmt == 'json'))
-                terminated.append({"provider": provider, "instance_id": ident, "label": None})
+                provider_name = future.result()
             except Exception as e:
                 failed.append({"instance_id": ident, "error": str(e)})
+                continue
+            if fmt != 'json':
+                click.echo(f"Terminated instance '{ident}' on '{provider_name}'.")
+            terminated.append({"provider": provider_name, "instance_id": ident, "label": None})
         _emit_terminate_result(fmt, terminated, failed)
 
     except ConfigNotFoundError:
@@ -438,6 +516,8 @@ def list_command(provider, output, args):  # Renamed from 'list' to avoid confli
     if target or verbose:
         detail = True
 
+    from gmab.commands.list import list_boxes, get_detailed_instances
+
     try:
         # Check if provider is configured
         if provider and provider not in get_configured_providers():
@@ -461,8 +541,12 @@ def list_command(provider, output, args):  # Renamed from 'list' to avoid confli
             if not details:
                 click.echo("No active instances found.")
                 return
-            for inst, raw, extras in details:
-                render_instance_detail(inst, raw, extras, verbose)
+            # Buffer every instance's table and write them out in one go when
+            # the console context exits, instead of one write per table.
+            console = Console()
+            with console:
+                for inst, raw, extras in details:
+                    render_instance_detail(inst, raw, extras, verbose, console=console)
             return
 
         instances = list_boxes(provider)
@@ -484,7 +568,7 @@ def list_command(provider, output, args):  # Renamed from 'list' to avoid confli
 @cli.command()
 @click.option(
     '--provider', '-p',
-    type=click.Choice(['all'] + get_available_providers()),
+    type=LazyChoice(_configure_provider_choices),
     default='all',
     help='Specific provider to configure (default: all providers).'
 )
@@ -505,11 +589,70 @@ def configure(provider, print_config):
     
     You can override the config location by setting the GMAB_CONFIG_DIR environment variable.
     """
+    from gmab.commands.configure import run_configure, print_configs
+
     if print_config:
         print_configs()
     else:
         run_configure(provider)
 
+# Where `gmab completion <shell> --install` writes the script: locations each
+# shell picks up without editing its rc file (zsh needs ~/.zfunc on $fpath).
+COMPLETION_PATHS = {
+    'bash': '~/.local/share/bash-completion/completions/gmab',
+    'zsh': '~/.zfunc/_gmab',
+    'fish': '~/.config/fish/completions/gmab.fish',
+}
+
+@cli.command()
+@click.argument('shell', type=click.Choice(sorted(COMPLETION_PATHS)))
+@click.option('--install', is_flag=True,
+              help="Write the script to the shell's completion directory instead of printing it.")
+def completion(shell, install):
+    """ Print or install the shell completion script.
+
+    Installing the generated script once avoids re-running gmab on every new
+    shell just to produce it (as `eval "$(_GMAB_COMPLETE=bash_source gmab)"`
+    in an rc file does).
+
+    \b
+    Examples:
+      gmab completion bash --install
+      gmab completion zsh > ~/.zfunc/_gmab
+    """
+    from pathlib import Path
+    from click.shell_completion import get_completion_class
+
+    comp_cls = get_completion_class(shell)
+    script = comp_cls(cli, {}, 'gmab', '_GMAB_COMPLETE').source()
+    if not install:
+        click.echo(script)
+        return
+
+    path = Path(COMPLETION_PATHS[shell]).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(script, encoding='utf-8')
+    click.echo(f"Installed {shell} completion to {path}")
+    click.echo("Start a new shell to pick it up.")
+
+@cli.group()
+def cache():
+    """ Manage gmab's local API/lookup cache. """
+
+@cache.command(name='clear')
+def cache_clear():
+    """ Delete cached provider lookups and the instance index.
+
+    gmab caches slow-changing provider answers (e.g. AWS VPC/subnet/security
+    group IDs) and very recent instance listings under the config dir. Clear
+    them if something was changed outside gmab and you don't want to wait for
+    them to expire.
+    """
+    from gmab.utils.api_cache import clear_cache
+
+    removed = clear_cache()
+    click.echo(f"Cleared {removed} cache file(s).")
+
 def main():
     cli()
 
@@ -2,22 +2,42 @@
 
 import click
 from pathlib import Path
-import json
 from gmab.utils.paths import get_config_file_path, ensure_config_dir_exists
 from gmab.utils.config_loader import (
-    load_config, save_config, DEFAULT_GENERAL_CONFIG, ConfigNotFoundError
+    load_config, save_config, dumps_config, DEFAULT_GENERAL_CONFIG, ConfigNotFoundError
 )
 from gmab.providers import get_registry, get_available_providers
 
 def update_nested_dict(original, updates):
-    """Recursively update a nested dictionary without overwriting unspecified values."""
-    for key, value in updates.items():
-        if key in original and isinstance(original[key], dict) and isinstance(value, dict):
-            update_nested_dict(original[key], value)
-        elif value is not None:  # Only update if value is not None
-            original[key] = value
+    """Update a nested dictionary in place without overwriting unspecified values."""
+    # Walk with an explicit stack of (target, updates) pairs instead of recursing.
+    stack = [(original, updates)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                stack.append((target[key], value))
+            elif value is not None:  # Only update if value is not None
+                target[key] = value
     return original
 
+def mask_provider_secrets(providers_config):
+    """
+    Return a view of providers.json with every secret value replaced by
+    '********', using each provider's declared secret keys. Built in a single
+    pass; the input is left untouched.
+    """
+    registry = get_registry()
+    masked = {}
+    for provider_name, provider in providers_config.items():
+        provider_cls = registry.get(provider_name)
+        secret_keys = set(provider_cls.secret_keys()) if provider_cls else set()
+        masked[provider_name] = {
+            key: '********' if key in secret_keys else value
+            for key, value in provider.items()
+        }
+    return masked
+
 def print_configs():
     """Print the current configuration files and their contents."""
     config_files = {
@@ -32,24 +52,13 @@ def print_configs():
         
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    # Handle sensitive data
-                    if filename == 'providers.json':
-                        # Mask sensitive values in a copy of the config, using each
-                        # provider's declared secret keys.
-                        registry = get_registry()
-                        masked_config = json.loads(json.dumps(config_data))
-                        for provider_name, provider in masked_config.items():
-                            provider_cls = registry.get(provider_name)
-                            secret_keys = provider_cls.secret_keys() if provider_cls else []
-                            for key in provider:
-                                if key in secret_keys:
-                                    provider[key] = '********'
-                        config_data = masked_config
-                    
-                    click.echo("Contents:")
-                    click.echo(json.dumps(config_data, indent=2))
+                config_data = load_config(filename)
+                # Handle sensitive data
+                if filename == 'providers.json':
+                    config_data = mask_provider_secrets(config_data)
+
+                click.echo("Contents:")
+                click.echo(dumps_config(config_data))
             except Exception as e:
                 click.echo(f"Error reading configuration: {str(e)}")
         else:
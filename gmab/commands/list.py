@@ -1,24 +1,41 @@
 ﻿# gmab/commands/list.py
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from gmab.providers import get_provider
 from gmab.utils.config_loader import load_config, ConfigNotFoundError
+from gmab.utils.instance_index import save_instance_index
 import time
 import click
 
-def get_lifetime_left(instance):
-    """Calculate the lifetime left in minutes for an instance."""
+def get_lifetime_left(instance, now=None):
+    """Calculate the lifetime left in minutes for an instance, as of `now`
+    (a unix timestamp; defaults to the current time)."""
+    if now is None:
+        now = time.time()
     creation_time = instance.get('creation_time', 0)
     lifetime_minutes = instance.get('lifetime_minutes', 60)
-    elapsed_minutes = (time.time() - creation_time) / 60
+    elapsed_minutes = (now - creation_time) / 60
     return max(0, lifetime_minutes - elapsed_minutes)
 
-def list_boxes(provider_name=None):
+def _list_provider_instances(provider_name, provider_cfg, for_lookup=False):
+    """Instantiate one provider and list its instances (run in a worker thread)."""
+    provider = get_provider(provider_name, provider_cfg)
+    return provider.lookup_instances() if for_lookup else provider.list_instances()
+
+def list_boxes(provider_name=None, *, compute_lifetime=True, for_lookup=False):
     """
     Retrieve all gmab-tagged instances from the specified provider(s).
     If no provider is specified, list instances from all configured providers.
     
     Args:
         provider_name (str, optional): The provider to list instances from. If None, list from all providers.
+        compute_lifetime (bool): Add `lifetime_left` to each instance and sort by it
+            (descending). Callers that never display the instances (e.g.
+            `terminate all -y`) can skip this.
+        for_lookup (bool): Resolving terminate targets rather than showing a
+            listing, so providers may answer from a recent cached listing (see
+            ProviderBase.lookup_instances()).
         
     Returns:
         list: A list of instance dictionaries with provider, instance_id, label, etc.
@@ -38,31 +55,49 @@ def list_boxes(provider_name=None):
         # If no provider specified, try to list from all configured providers
         if provider_name is None:
             # Now we only iterate over providers that actually have a configuration
-            for provider_name, provider_cfg in providers_config.items():
-                if not provider_cfg:  # Skip empty configs
-                    continue
-                    
-                try:
-                    provider = get_provider(provider_name, provider_cfg)
-                    provider_instances = provider.list_instances()
-                    instances.extend(provider_instances)
-                except Exception as e:
-                    click.echo(f"Warning: Failed to list instances from provider '{provider_name}': {str(e)}")
+            configured = {name: cfg for name, cfg in providers_config.items() if cfg}
+            results = {}
+            if configured:
+                # Each provider call is a network round-trip, so query them all at
+                # once: `gmab list` then takes as long as the slowest provider
+                # rather than the sum of all of them.
+                with ThreadPoolExecutor(max_workers=len(configured)) as executor:
+                    futures = {
+                        executor.submit(_list_provider_instances, name, cfg, for_lookup): name
+                        for name, cfg in configured.items()
+                    }
+                    for future in as_completed(futures):
+                        name = futures[future]
+                        try:
+                            results[name] = future.result()
+                        except Exception as e:
+                            click.echo(f"Warning: Failed to list instances from provider '{name}': {str(e)}")
+
+            # Merge in config order so the output doesn't depend on which
+            # provider happened to answer first.
+            for name in configured:
+                instances.extend(results.get(name, []))
+
+            # Remember who owns what, so `terminate <label>` can skip the scan.
+            save_instance_index(instances)
         else:
             # List instances from specific provider
             provider_cfg = providers_config.get(provider_name)
             if not provider_cfg:
                 raise ValueError(f"Provider '{provider_name}' is not configured. Run 'gmab configure -p {provider_name}' first.")
 
-            provider = get_provider(provider_name, provider_cfg)
-            instances = provider.list_instances()
+            instances = _list_provider_instances(provider_name, provider_cfg, for_lookup)
+
+        if not compute_lifetime:
+            return instances
 
         # Calculate lifetime left for each instance and add it to the instance data
+        now = time.time()
         for instance in instances:
-            instance['lifetime_left'] = get_lifetime_left(instance)
+            instance['lifetime_left'] = get_lifetime_left(instance, now)
 
         # Sort instances by lifetime left (descending)
-        instances.sort(key=lambda x: x['lifetime_left'], reverse=True)
+        instances.sort(key=itemgetter('lifetime_left'), reverse=True)
 
         return instances
         
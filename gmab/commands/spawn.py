@@ -5,8 +5,21 @@ from gmab.utils.config_loader import load_config, ConfigNotFoundError
 from gmab.utils.output import emit_json, instance_to_json
 from gmab.providers import get_provider
 
-def spawn_box(provider_name=None, region=None, image=None, lifetime=None, output="text"):
-    """Spawn a new cloud instance with the specified parameters."""
+def _echo_spawned(provider_name, instance_info, ssh_user):
+    click.echo(f"Spawned '{provider_name}' instance:")
+    click.echo(f"  ID: {instance_info['instance_id']}")
+    click.echo(f"  Label: {instance_info['label']}")
+    click.echo(f"  IP: {instance_info['ip']}")
+    click.echo(f"  Connect via: ssh {ssh_user}@{instance_info['ip']}")
+
+def spawn_box(provider_name=None, region=None, image=None, lifetime=None, output="text", count=1):
+    """
+    Spawn new cloud instances with the specified parameters.
+
+    Returns the instance dict, or with count > 1 the list of spawned instance
+    dicts (spawned concurrently; failures are reported, and only raise if
+    every spawn failed).
+    """
     try:
         # Load main configs
         general_cfg = load_config("config.json")
@@ -29,23 +42,41 @@ def spawn_box(provider_name=None, region=None, image=None, lifetime=None, output
         # Instantiate provider
         provider = get_provider(provider_name, provider_cfg)
 
-        # Spawn instance
-        instance_info = provider.spawn_instance(
+        spawn_kwargs = dict(
             image=chosen_image,
             region=chosen_region,
             ssh_key_path=general_cfg["ssh_key_path"],
             lifetime_minutes=chosen_lifetime
         )
-
         ssh_user = provider.ssh_user(chosen_image)
+
+        if count > 1:
+            instances, errors = provider.spawn_instances(count, **spawn_kwargs)
+            if not instances:
+                raise Exception(errors[0])
+            if output == "json":
+                emit_json({
+                    "spawned": [{**instance_to_json(i), "ssh_user": ssh_user} for i in instances],
+                    "failed": errors,
+                    "spawned_count": len(instances),
+                    "failed_count": len(errors),
+                })
+            else:
+                for instance_info in instances:
+                    _echo_spawned(provider_name, instance_info, ssh_user)
+                if errors:
+                    click.echo(f"\nFailed to spawn {len(errors)} of {count} instances:")
+                    for error in errors:
+                        click.echo(f"- {error}")
+            return instances
+
+        # Spawn instance
+        instance_info = provider.spawn_instance(**spawn_kwargs)
+
         if output == "json":
             emit_json({**instance_to_json(instance_info), "ssh_user": ssh_user})
         else:
-            click.echo(f"Spawned '{provider_name}' instance:")
-            click.echo(f"  ID: {instance_info['instance_id']}")
-            click.echo(f"  Label: {instance_info['label']}")
-            click.echo(f"  IP: {instance_info['ip']}")
-            click.echo(f"  Connect via: ssh {ssh_user}@{instance_info['ip']}")
+            _echo_spawned(provider_name, instance_info, ssh_user)
 
         return instance_info
     
@@ -1,8 +1,11 @@
 # gmab/commands/terminate.py
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from gmab.utils.config_loader import load_config, ConfigNotFoundError
-from gmab.providers import get_provider, get_registry
+from gmab.utils.instance_index import lookup_instance, invalidate_instance_index
+from gmab.providers import get_provider, get_identifier_owner
 
 def get_instance_provider(instance_identifier, providers_cfg):
     """
@@ -16,31 +19,71 @@ def get_instance_provider(instance_identifier, providers_cfg):
     Returns:
         tuple: (provider_name, provider_instance) or (None, None) if not found
     """
-    # Fast path: if a provider recognizes this identifier as its own native ID
-    # format (e.g. AWS "i-..."), use it directly when it's configured.
-    for provider_name, provider_class in get_registry().items():
-        if provider_class.claims_identifier(instance_identifier) and providers_cfg.get(provider_name):
-            provider = get_provider(provider_name, providers_cfg[provider_name])
-            return provider_name, provider
-
-    # Otherwise (labels, numeric IDs, unconfigured fast-path), query each provider
-    for provider_name, provider_cfg in providers_cfg.items():
-        if not provider_cfg:  # Skip empty provider configs
-            continue
-            
-        provider = get_provider(provider_name, provider_cfg)
-        try:
-            instances = provider.list_instances()
-            
-            for instance in instances:
-                if (instance['instance_id'] == instance_identifier or 
-                    instance['label'] == instance_identifier):
-                    return provider_name, provider
-        except Exception:
-            # Skip providers that fail to list instances
-            continue
-
-    return None, None
+    provider_name, provider, _ = locate_instance(instance_identifier, providers_cfg)
+    return provider_name, provider
+
+def locate_instance(instance_identifier, providers_cfg):
+    """
+    Like get_instance_provider(), but also return the matching instance record,
+    so callers can act on its native ID without listing the provider again.
+
+    Returns:
+        tuple: (provider_name, provider_instance, instance) or (None, None, None)
+            if not found. `instance` is the lookup_instances() dict, or None when
+            the provider was picked from the identifier's format alone. A
+            record found in the instance index (see gmab.utils.instance_index)
+            only carries provider and instance_id.
+    """
+    configured = {name: cfg for name, cfg in providers_cfg.items() if cfg}  # Skip empty provider configs
+
+    # Fast path: if a configured provider recognizes this identifier as its own
+    # native ID format (e.g. AWS "i-..."), use it directly.
+    provider_name = get_identifier_owner(instance_identifier, configured)
+    if provider_name:
+        provider = get_provider(provider_name, providers_cfg[provider_name])
+        return provider_name, provider, None
+
+    # A recent `gmab list` may already have recorded who owns this instance.
+    indexed = lookup_instance(instance_identifier)
+    if indexed and providers_cfg.get(indexed[0]):
+        provider_name, native_id = indexed
+        provider = get_provider(provider_name, providers_cfg[provider_name])
+        return provider_name, provider, {"provider": provider_name, "instance_id": native_id}
+
+    # Otherwise (labels, numeric IDs, unconfigured fast-path), query every
+    # configured provider at once. The match is still picked in config order:
+    # Linode and Hetzner both use bare numeric IDs, so the same number can
+    # exist on two providers and must resolve the same way every time.
+    if not configured:
+        return None, None, None
+
+    # Every provider's listing is already in flight, so leaving the block still
+    # waits for the slowest one; the scan costs that one call, not their sum.
+    with ThreadPoolExecutor(max_workers=len(configured)) as executor:
+        futures = [
+            (name, executor.submit(_find_owned_instance, name, cfg, instance_identifier))
+            for name, cfg in configured.items()
+        ]
+        for name, future in futures:
+            try:
+                provider, instance = future.result()
+            except Exception:
+                # Skip providers that fail to list instances
+                continue
+            if instance is not None:
+                return name, provider, instance
+
+    return None, None, None
+
+def _find_owned_instance(provider_name, provider_cfg, instance_identifier):
+    """Return (provider, instance) for the instance with this ID or label;
+    instance is None if the provider doesn't have it."""
+    provider = get_provider(provider_name, provider_cfg)
+    for instance in provider.lookup_instances():
+        if (instance['instance_id'] == instance_identifier or
+                instance['label'] == instance_identifier):
+            return provider, instance
+    return provider, None
 
 def terminate_box(instance_id, provider_name=None, quiet=False):
     """
@@ -49,7 +92,12 @@ def terminate_box(instance_id, provider_name=None, quiet=False):
     Args:
         instance_id (str): The instance ID or label to terminate
         provider_name (str, optional): The provider name. If None, it will be determined from the instance ID.
-        quiet (bool): Suppress the human-readable confirmation echo (used in JSON mode).
+        quiet (bool): Suppress the human-readable confirmation echo (used in JSON
+            mode, and by callers terminating several instances at once that
+            echo the confirmations themselves, in order).
+
+    Returns:
+        str: The name of the provider the instance was terminated on.
 
     Raises:
         ConfigNotFoundError: If configuration files don't exist
@@ -61,6 +109,7 @@ def terminate_box(instance_id, provider_name=None, quiet=False):
         providers_cfg = load_config("providers.json")
         general_cfg = load_config("config.json")
 
+        target = instance_id
         if provider_name:
             # If provider is specified, use it directly
             provider_cfg = providers_cfg.get(provider_name)
@@ -69,18 +118,59 @@ def terminate_box(instance_id, provider_name=None, quiet=False):
             provider = get_provider(provider_name, provider_cfg)
         else:
             # Try to determine provider from instance ID
-            provider_name, provider = get_instance_provider(instance_id, providers_cfg)
+            provider_name, provider, instance = locate_instance(instance_id, providers_cfg)
             if not provider:
                 raise ValueError(f"Could not determine provider for instance '{instance_id}'. Make sure the provider is configured.")
+            if instance is not None:
+                # Already listed while locating it: pass the native ID so the
+                # provider doesn't list again to resolve a label.
+                target = instance['instance_id']
 
         # Terminate the instance
-        provider.terminate_instance(instance_id)
+        provider.terminate_instance(target)
+        invalidate_instance_index()
         if not quiet:
             click.echo(f"Terminated instance '{instance_id}' on '{provider_name}'.")
+        return provider_name
         
     except ConfigNotFoundError:
         # Let the CLI handle this error
         raise
     except Exception as e:
         # Re-raise with a more informative message
-        raise Exception(f"Failed to terminate instance: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to terminate instance: {str(e)}")
+
+def terminate_boxes(instance_ids, provider_name, quiet=False):
+    """
+    Terminate several instances on one provider, letting the provider batch
+    them (see ProviderBase.terminate_instances) instead of one call per ID.
+
+    Args:
+        instance_ids (list): The instance IDs or labels to terminate
+        provider_name (str): The provider all of the instances belong to
+        quiet (bool): Suppress the human-readable confirmation echo (used in JSON mode).
+
+    Returns:
+        dict: {instance_id: error message} for every ID that failed; empty when
+            all of them were terminated.
+
+    Raises:
+        ConfigNotFoundError: If configuration files don't exist
+        ValueError: If the provider is not configured
+    """
+    providers_cfg = load_config("providers.json")
+    provider_cfg = providers_cfg.get(provider_name)
+    if not provider_cfg:
+        raise ValueError(f"Provider '{provider_name}' is not configured. Run 'gmab configure -p {provider_name}' first.")
+    provider = get_provider(provider_name, provider_cfg)
+
+    errors = {
+        instance_id: f"Failed to terminate instance: {error}"
+        for instance_id, error in provider.terminate_instances(list(instance_ids)).items()
+    }
+    invalidate_instance_index()
+    if not quiet:
+        for instance_id in instance_ids:
+            if instance_id not in errors:
+                click.echo(f"Terminated instance '{instance_id}' on '{provider_name}'.")
+    return errors
\ No newline at end of file
@@ -1,14 +1,39 @@
 # gmab/providers/__init__.py
 
+import functools
+import importlib
+
 from gmab.providers.base import ProviderBase, ConfigField
-from gmab.providers.registry import get_registry, get_available_providers
+from gmab.providers.registry import (
+    get_registry,
+    get_available_providers,
+    get_provider_class,
+    get_identifier_owner,
+)
+
+# The shipped provider classes stay importable from here for backward
+# compatibility (e.g. `from gmab.providers import LinodeProvider`), but are only
+# imported on first access (PEP 562): each one pulls in its SDK (boto3 alone
+# costs hundreds of ms), and most commands touch a single provider.
+_PROVIDER_MODULES = {
+    "LinodeProvider": "gmab.providers.linode",
+    "AWSProvider": "gmab.providers.aws",
+    "HetznerProvider": "gmab.providers.hetzner",
+    "OVHProvider": "gmab.providers.ovh",
+}
+
+
+def __getattr__(attr):
+    module_name = _PROVIDER_MODULES.get(attr)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    provider_class = getattr(importlib.import_module(module_name), attr)
+    globals()[attr] = provider_class  # later lookups skip __getattr__
+    return provider_class
+
 
-# Re-export the shipped provider classes for backward-compatible imports
-# (e.g. `from gmab.providers import LinodeProvider`).
-from gmab.providers.linode import LinodeProvider
-from gmab.providers.aws import AWSProvider
-from gmab.providers.hetzner import HetznerProvider
-from gmab.providers.ovh import OVHProvider
+def __dir__():
+    return sorted(set(globals()) | set(_PROVIDER_MODULES))
 
 
 def get_provider(provider_name, provider_cfg):
@@ -25,11 +50,29 @@ def get_provider(provider_name, provider_cfg):
     Raises:
         ValueError: If the provider name is unknown or if provider config is invalid
     """
-    provider_class = get_registry().get(provider_name)
+    provider_class = get_provider_class(provider_name)
     if not provider_class:
         raise ValueError(f"Unknown provider: {provider_name}")
 
     if not provider_cfg:
         raise ValueError(f"Missing or empty configuration for provider: {provider_name}")
 
-    return provider_class(provider_cfg)
+    try:
+        frozen_cfg = tuple(sorted(provider_cfg.items()))
+        hash(frozen_cfg)
+    except TypeError:
+        # Unhashable (nested) config values: nothing to key a cache entry on.
+        return provider_class(provider_cfg)
+    return _cached_provider(provider_class, frozen_cfg)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_provider(provider_class, frozen_cfg):
+    """
+    Build a provider once per (class, config) pair. Construction can be costly
+    (AWS builds a boto3 session and clients), and a single command often asks
+    for the same provider repeatedly, e.g. once per instance in `terminate`.
+    The key is the config's contents, so an edited providers.json simply gets
+    a new instance.
+    """
+    return provider_class(dict(frozen_cfg))
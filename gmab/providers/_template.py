@@ -42,11 +42,10 @@ class TemplateProvider(ProviderBase):
         ConfigField("default_type", "Default instance type", default="small"),
     ]
 
-    # Optional: only override if your provider has an unambiguous native ID
-    # format. Returning True lets `terminate` skip querying every provider.
-    # @classmethod
-    # def claims_identifier(cls, identifier):
-    #     return identifier.startswith("inst-")
+    # Optional: only set if your provider has an unambiguous native ID prefix.
+    # A match lets `terminate` skip querying every provider. (Override
+    # claims_identifier() instead if a prefix can't describe the format.)
+    # ID_PREFIXES = ("inst-",)
 
     def spawn_instance(self, image=None, region=None, ssh_key_path=None, lifetime_minutes=None):
         # Resolve effective values from args, falling back to configured defaults.
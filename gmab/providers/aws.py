@@ -1,10 +1,93 @@
 # gmab/providers/aws.py
 
-import boto3
+import functools
+import hashlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from gmab.providers.base import ProviderBase, ConfigField
+from gmab.utils.api_cache import cache_get, cache_put, cache_invalidate
 from gmab.utils.naming import make_label
 
+CACHE_NAMESPACE = "aws"
+# The gmab VPC/subnet/SG are created once per region and then never change, so
+# their IDs can be reused across runs instead of re-describing them every spawn.
+# If they do get deleted, run_instances fails with one of STALE_NETWORK_ERRORS
+# and spawn re-resolves them, so the entry can live for a long time.
+NETWORK_CACHE_TTL = 7 * 24 * 60 * 60
+STALE_NETWORK_ERRORS = {
+    'InvalidSubnetID.NotFound',
+    'InvalidGroup.NotFound',
+    'InvalidVpcID.NotFound',
+}
+# `gmab list` always describes live and records the result, which a following
+# terminate's lookups may reuse for this long; gmab's own spawn/terminate drop
+# the entry immediately.
+LIST_CACHE_TTL = 30
+# EC2 rejects TerminateInstances/DescribeInstances calls with more IDs than this.
+TERMINATE_BATCH_SIZE = 1000
+# DescribeInstances page size (MaxResults) for listings.
+LIST_PAGE_SIZE = 100
+# boto3's instance_running waiter polls every 15s (40 attempts), adding up to
+# 15s of idle wait to a spawn. Poll every 3s instead, keeping the same 10 minute
+# ceiling for slow-booting images.
+RUNNING_WAITER_CONFIG = {'Delay': 3, 'MaxAttempts': 200}
+# Key pairs: one shared pair per public key (named after its hash) that is
+# kept across terminates, vs. the per-instance pairs older versions created
+# and which terminate still cleans up.
+SHARED_KEY_PREFIX = 'gmab-pubkey-'
+LEGACY_KEY_PREFIX = 'gmab-key-'
+
+
+# Fixed DescribeX filters, built once instead of on every call. boto3 only
+# reads these (and accepts tuples for list parameters).
+_GMAB_TAG_FILTER = {'Name': 'tag:gmab', 'Values': ('true',)}
+_LIVE_STATE_FILTER = {
+    'Name': 'instance-state-name',
+    'Values': ('pending', 'running', 'stopping', 'stopped'),
+}
+_GMAB_INSTANCE_FILTERS = (_GMAB_TAG_FILTER, _LIVE_STATE_FILTER)
+_GMAB_VPC_FILTER = {'Name': 'tag:Name', 'Values': ('gmab-vpc',)}
+_GMAB_SG_FILTER = {'Name': 'group-name', 'Values': ('gmab-sg',)}
+_GMAB_SUBNET_FILTER = {'Name': 'tag:Name', 'Values': ('gmab-subnet',)}
+
+
+def _error_code(error):
+    """The AWS error code of a botocore ClientError (None for anything else)."""
+    return getattr(error, 'response', {}).get('Error', {}).get('Code')
+
+
+@functools.lru_cache(maxsize=4)
+def _ec2_clients(access_key, secret_key, region):
+    """
+    Build (session, ec2 client, ec2 resource) once per credentials/region.
+
+    Creating a session and its clients loads botocore's JSON service models and
+    opens a new connection pool, so every AWSProvider with the same settings
+    shares one set. boto3 is imported here rather than at module level so that
+    merely registering this provider doesn't cost boto3's import time.
+    """
+    import boto3
+    from botocore.config import Config
+
+    # Adaptive mode retries throttling and transient 5xx errors with backoff
+    # (and client-side rate limiting) before anything reaches our handlers.
+    client_config = Config(
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        max_pool_connections=50
+    )
+    session = boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region
+    )
+    return (
+        session,
+        session.client('ec2', config=client_config),
+        session.resource('ec2', config=client_config),
+    )
+
 class AWSProvider(ProviderBase):
     """
     Provider implementation for AWS EC2.
@@ -23,33 +106,101 @@ class AWSProvider(ProviderBase):
         ConfigField("default_type", "Default instance type", default="t3.micro"),
     ]
 
+    ID_PREFIXES = ('i-',)
+
     def __init__(self, provider_cfg):
         super().__init__(provider_cfg)
-        self.session = boto3.Session(
-            aws_access_key_id=provider_cfg.get('access_key'),
-            aws_secret_access_key=provider_cfg.get('secret_key'),
-            region_name=provider_cfg.get('default_region', 'us-east-1')
+        # instance_id -> KeyName for instances described in this process, so
+        # terminate can skip re-describing what list/label lookups already saw.
+        self._key_names = {}
+        # Key pair names imported (or found already imported) by this object.
+        self._imported_keys = set()
+        # Serializes network resolution so concurrent spawns (spawn --count)
+        # never create the gmab VPC/SG/subnet more than once.
+        self._network_lock = threading.Lock()
+
+    def _clients(self):
+        """
+        The shared (session, ec2 client, ec2 resource) for this config. Only
+        reached through the lazy properties below, so a provider that is merely
+        constructed (e.g. picked by `terminate`'s ID fast path before anything
+        is called on it) never imports boto3 or loads botocore models.
+        """
+        return _ec2_clients(
+            self.provider_cfg.get('access_key'),
+            self.provider_cfg.get('secret_key'),
+            self.provider_cfg.get('default_region', 'us-east-1')
         )
-        self.ec2 = self.session.client('ec2')
-        self.ec2_resource = self.session.resource('ec2')
 
-    @classmethod
-    def claims_identifier(cls, identifier):
-        """AWS instance IDs use the 'i-' prefix."""
-        return identifier.startswith('i-')
+    @functools.cached_property
+    def session(self):
+        return self._clients()[0]
+
+    @functools.cached_property
+    def ec2(self):
+        return self._clients()[1]
+
+    @functools.cached_property
+    def ec2_resource(self):
+        return self._clients()[2]
 
     def ssh_user(self, image=None):
         # The default AMI is Ubuntu (login user 'ubuntu'). Amazon Linux images use
         # 'ec2-user', but an AMI ID doesn't reveal the distro, so assume the default.
         return "ubuntu"
 
+    def _cache_key(self, what):
+        # Scope entries to the account (hashed, never the raw key) and region.
+        account = hashlib.sha256(
+            (self.provider_cfg.get('access_key') or '').encode()
+        ).hexdigest()[:12]
+        region = self.provider_cfg.get('default_region', 'us-east-1')
+        return f"{account}:{region}:{what}"
+
+    def _cached(self, what, ttl, fetch):
+        """Return the cached value for `what`, calling `fetch()` on a miss."""
+        key = self._cache_key(what)
+        value = cache_get(CACHE_NAMESPACE, key, ttl)
+        if value is None:
+            value = fetch()
+            cache_put(CACHE_NAMESPACE, key, value)
+        return value
+
+    def _invalidate_instances(self):
+        cache_invalidate(CACHE_NAMESPACE, self._cache_key("instances"))
+
+    def _network(self):
+        """[vpc_id, security_group_id, subnet_id], from the cache when possible."""
+        with self._network_lock:
+            return self._cached("network", NETWORK_CACHE_TTL, self._resolve_network)
+
+    def _refresh_network(self, stale):
+        """
+        Re-resolve the network after run_instances rejected the `stale` IDs. If
+        another spawn already replaced them meanwhile, its result is reused.
+        """
+        with self._network_lock:
+            key = self._cache_key("network")
+            current = cache_get(CACHE_NAMESPACE, key, NETWORK_CACHE_TTL)
+            if current is not None and current != stale:
+                return current
+            cache_invalidate(CACHE_NAMESPACE, key)
+            return self._cached("network", NETWORK_CACHE_TTL, self._resolve_network)
+
+    def _resolve_network(self):
+        """Return [vpc_id, security_group_id, subnet_id], creating them if needed."""
+        vpc_id = self.get_or_create_vpc()
+        # The security group and subnet lookups only depend on the VPC.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            subnet_future = pool.submit(self.get_subnet_id, vpc_id)
+            security_group_id = self.get_or_create_security_group(vpc_id)
+            return [vpc_id, security_group_id, subnet_future.result()]
+
     def get_or_create_vpc(self):
         """Get existing gmab VPC or create a new one."""
         # Check for existing gmab VPC
         vpcs = self.ec2.describe_vpcs(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': ['gmab-vpc']}
-            ]
+            Filters=[_GMAB_VPC_FILTER]
         )['Vpcs']
 
         if vpcs:
@@ -136,7 +287,7 @@ class AWSProvider(ProviderBase):
             # Check for existing security group
             security_groups = self.ec2.describe_security_groups(
                 Filters=[
-                    {'Name': 'group-name', 'Values': ['gmab-sg']},
+                    _GMAB_SG_FILTER,
                     {'Name': 'vpc-id', 'Values': [vpc_id]}
                 ]
             )['SecurityGroups']
@@ -177,14 +328,14 @@ class AWSProvider(ProviderBase):
             return security_group_id
 
         except Exception as e:
-            raise Exception(f"Failed to setup security group: {str(e)}")
+            raise Exception(f"Failed to setup security group: {str(e)}") from e
 
     def get_subnet_id(self, vpc_id):
         """Get the gmab subnet ID for the given VPC."""
         subnets = self.ec2.describe_subnets(
             Filters=[
                 {'Name': 'vpc-id', 'Values': [vpc_id]},
-                {'Name': 'tag:Name', 'Values': ['gmab-subnet']}
+                _GMAB_SUBNET_FILTER
             ]
         )['Subnets']
 
@@ -193,32 +344,88 @@ class AWSProvider(ProviderBase):
         
         return subnets[0]['SubnetId']
 
-    def find_instance_id_by_label(self, label):
-        """Find instance ID by label, but only for instances with the 'gmab' tag."""
+    def _get_or_import_key(self, public_key):
+        """
+        Return the name of a gmab key pair holding `public_key`, importing it
+        if needed. The name is derived from the key itself, so repeated spawns
+        with the same key reuse one pair instead of creating one per instance.
+        Shared pairs are never deleted (see _delete_gmab_key_pairs).
+        """
+        key_name = f"{SHARED_KEY_PREFIX}{hashlib.sha256(public_key.encode()).hexdigest()[:16]}"
+        if key_name in self._imported_keys:
+            return key_name
         try:
-            response = self.ec2.describe_instances(
-                Filters=[
-                    {'Name': 'tag:Name', 'Values': [label]},
-                    {'Name': 'tag:gmab', 'Values': ['true']},
-                    {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
-                ]
+            self.ec2.import_key_pair(
+                KeyName=key_name,
+                PublicKeyMaterial=public_key.encode()
             )
+        except Exception as e:
+            if _error_code(e) != 'InvalidKeyPair.Duplicate':
+                raise Exception(f"Failed to import SSH key to AWS: {str(e)}") from e
+        self._imported_keys.add(key_name)
+        return key_name
+
+    def find_instance_by_label(self, label):
+        """
+        Find a running/stopped gmab-tagged instance by its Name tag and return
+        its full EC2 description (KeyName, Tags, ...), or None.
 
+        A label that matches nothing is an empty result, not an error, so API
+        errors (bad credentials, throttling that outlasted the retries) are
+        raised rather than reported as "not found".
+        """
+        response = self.ec2.describe_instances(
+            Filters=[
+                {'Name': 'tag:Name', 'Values': [label]},
+                _GMAB_TAG_FILTER,
+                _LIVE_STATE_FILTER
+            ]
+        )
+
+        for reservation in response['Reservations']:
+            for instance in reservation['Instances']:
+                self._key_names[instance['InstanceId']] = instance.get('KeyName')
+                return instance
+
+        return None
+
+    def find_instance_id_by_label(self, label):
+        """Find instance ID by label, but only for instances with the 'gmab' tag."""
+        instance = self.find_instance_by_label(label)
+        return instance['InstanceId'] if instance else None
+
+    def _lookup_key_names(self, instance_ids):
+        """
+        Return {instance_id: KeyName} for the given IDs. IDs already seen by
+        list_instances() or a label lookup in this process are answered from
+        memory; only the rest cost a DescribeInstances call.
+        """
+        unknown = [i for i in instance_ids if i not in self._key_names]
+        if unknown:
+            response = self.ec2.describe_instances(InstanceIds=unknown)
             for reservation in response['Reservations']:
                 for instance in reservation['Instances']:
-                    return instance['InstanceId']
-            
-            return None
-        except Exception as e:
-            return None
+                    self._key_names[instance['InstanceId']] = instance.get('KeyName')
+        return {i: self._key_names.get(i) for i in instance_ids}
+
+    def _delete_gmab_key_pairs(self, key_names):
+        # Only legacy per-instance pairs (gmab-key-<random>) are removed. A
+        # shared pair (SHARED_KEY_PREFIX) belongs to every instance launched
+        # with that public key, and a spawn in another process may be about to
+        # launch with it.
+        for key_name in set(key_names):
+            if key_name and key_name.startswith(LEGACY_KEY_PREFIX):
+                try:
+                    self.ec2.delete_key_pair(KeyName=key_name)
+                except:
+                    pass  # Best effort cleanup
 
-    def _get_instance_expiry_info(self, instance):
-        """Helper method to get expiry information from instance tags."""
-        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
+    def _get_instance_expiry_info(self, tags, now=None):
+        """Helper method to get expiry information from an instance's {Key: Value} tags."""
         creation_time = int(tags.get('gmab-creation-time', '0'))
         lifetime_minutes = int(tags.get('gmab-lifetime', '60'))
 
-        is_expired = self.is_expired(creation_time, lifetime_minutes)
+        is_expired = self.is_expired(creation_time, lifetime_minutes, now)
         return creation_time, lifetime_minutes, is_expired
 
     def spawn_instance(self, image=None, region=None, ssh_key_path=None, lifetime_minutes=None):
@@ -244,58 +451,64 @@ class AWSProvider(ProviderBase):
         # Read SSH key
         ssh_key_content = self._read_ssh_key(ssh_key_path)
 
-        # Setup networking
-        vpc_id = self.get_or_create_vpc()
-        security_group_id = self.get_or_create_security_group(vpc_id)
-        subnet_id = self.get_subnet_id(vpc_id)
-
-        # Import SSH key to AWS
-        key_name = make_label(prefix="gmab-key", length=8)
-        try:
-            self.ec2.import_key_pair(
-                KeyName=key_name,
-                PublicKeyMaterial=ssh_key_content.encode()
-            )
-        except Exception as e:
-            raise Exception(f"Failed to import SSH key to AWS: {str(e)}")
+        # Setup networking (normally answered from the cache, no API calls)
+        # while the SSH key is imported to AWS (or the existing pair reused);
+        # the two are independent round trips.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            key_future = pool.submit(self._get_or_import_key, ssh_key_content)
+            network = self._network()
+            key_name = key_future.result()
+        _, security_group_id, subnet_id = network
 
         # Launch instance with standardized tags
+        launch_args = dict(
+            ImageId=chosen_image,
+            InstanceType=instance_type,
+            MinCount=1,
+            MaxCount=1,
+            KeyName=key_name,
+            TagSpecifications=[
+                {
+                    'ResourceType': 'instance',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': instance_name},
+                        {'Key': 'gmab', 'Value': 'true'},
+                        {'Key': 'gmab-creation-time', 'Value': str(creation_time)},
+                        {'Key': 'gmab-lifetime', 'Value': str(lifetime_minutes)}
+                    ]
+                }
+            ]
+        )
         try:
-            response = self.ec2.run_instances(
-                ImageId=chosen_image,
-                InstanceType=instance_type,
-                MinCount=1,
-                MaxCount=1,
-                KeyName=key_name,
-                SecurityGroupIds=[security_group_id],
-                SubnetId=subnet_id,
-                TagSpecifications=[
-                    {
-                        'ResourceType': 'instance',
-                        'Tags': [
-                            {'Key': 'Name', 'Value': instance_name},
-                            {'Key': 'gmab', 'Value': 'true'},
-                            {'Key': 'gmab-creation-time', 'Value': str(creation_time)},
-                            {'Key': 'gmab-lifetime', 'Value': str(lifetime_minutes)}
-                        ]
-                    }
-                ]
-            )
-        except Exception as e:
-            # Clean up the key pair if instance launch fails
             try:
-                self.ec2.delete_key_pair(KeyName=key_name)
-            except:
-                pass
-            raise Exception(f"Failed to launch AWS instance: {str(e)}")
+                response = self.ec2.run_instances(
+                    SecurityGroupIds=[security_group_id], SubnetId=subnet_id, **launch_args
+                )
+            except Exception as e:
+                if _error_code(e) not in STALE_NETWORK_ERRORS:
+                    raise
+                # The cached network was deleted behind our back: rebuild it and retry once.
+                _, security_group_id, subnet_id = self._refresh_network(network)
+                response = self.ec2.run_instances(
+                    SecurityGroupIds=[security_group_id], SubnetId=subnet_id, **launch_args
+                )
+        except Exception as e:
+            # The key pair is kept: it is named after the public key and shared
+            # with every other instance (and concurrent spawn) using that key.
+            raise Exception(f"Failed to launch AWS instance: {str(e)}") from e
 
         instance = response['Instances'][0]
         instance_id = instance['InstanceId']
+        self._invalidate_instances()
 
         try:
             # Wait for instance to be running and get its public IP
             waiter = self.ec2.get_waiter('instance_running')
-            waiter.wait(InstanceIds=[instance_id])
+            try:
+                waiter.wait(InstanceIds=[instance_id], WaiterConfig=RUNNING_WAITER_CONFIG)
+            finally:
+                # A lookup during the wait may have cached it as pending.
+                self._invalidate_instances()
 
             # Get instance details
             instance_info = self.ec2.describe_instances(InstanceIds=[instance_id])['Reservations'][0]['Instances'][0]
@@ -316,10 +529,21 @@ class AWSProvider(ProviderBase):
             # Clean up on error
             try:
                 self.ec2.terminate_instances(InstanceIds=[instance_id])
-                self.ec2.delete_key_pair(KeyName=key_name)
             except:
                 pass
-            raise Exception(f"Failed to get instance details: {str(e)}")
+            raise Exception(f"Failed to get instance details: {str(e)}") from e
+
+    def spawn_instances(self, count, **spawn_kwargs):
+        """
+        Spawn several instances concurrently (see ProviderBase.spawn_instances).
+        The key pair and the network are resolved once up front, so the
+        parallel spawns all find them ready instead of racing to import the
+        same key or create the gmab VPC.
+        """
+        if count > 1:
+            self._get_or_import_key(self._read_ssh_key(spawn_kwargs.get("ssh_key_path")))
+            self._network()
+        return super().spawn_instances(count, **spawn_kwargs)
 
     def terminate_instance(self, instance_identifier):
         """
@@ -328,67 +552,130 @@ class AWSProvider(ProviderBase):
             instance_identifier: Can be either an instance ID (i-xxxxx) or a label (gmab-xxxxx)
         """
         try:
-            # If it's not a typical AWS instance ID format, try to find by label
+            # If it's not a typical AWS instance ID format, try to find by label.
+            # That lookup already returns the KeyName, so no second describe.
             if not instance_identifier.startswith('i-'):
-                instance_id = self.find_instance_id_by_label(instance_identifier)
-                if instance_id is None:
+                instance = self.find_instance_by_label(instance_identifier)
+                if instance is None:
                     raise Exception(f"No instance found with label '{instance_identifier}'")
+                instance_id = instance['InstanceId']
             else:
                 instance_id = instance_identifier
 
-            # Get the instance tags to find our key pair name if it exists
-            response = self.ec2.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
-            
-            # Find any gmab key pairs associated with this instance
-            key_name = instance.get('KeyName')
-            if key_name and key_name.startswith('gmab-key-'):
-                try:
-                    self.ec2.delete_key_pair(KeyName=key_name)
-                except:
-                    pass  # Best effort cleanup
+            # Find any gmab key pair associated with this instance
+            self._delete_gmab_key_pairs(self._lookup_key_names([instance_id]).values())
 
             self.ec2.terminate_instances(InstanceIds=[instance_id])
+            self._invalidate_instances()
         except Exception as e:
-            raise Exception(f"Failed to terminate AWS instance: {str(e)}")
+            raise Exception(f"Failed to terminate AWS instance: {str(e)}") from e
 
-    def list_instances(self):
-        """List all EC2 instances tagged with 'gmab'."""
+    def terminate_instances(self, instance_ids):
+        """
+        Terminate several EC2 instances with a single TerminateInstances call
+        (plus one DescribeInstances to find their gmab key pairs, unless this
+        process has already described them) per TERMINATE_BATCH_SIZE IDs. If a
+        bulk call is rejected, e.g. because one ID no longer exists, fall back
+        to terminating that batch one by one so the rest still go and each
+        failure is reported against its own ID.
+        """
+        errors = {}
+        instance_ids_by_ref = {}
+        for identifier in instance_ids:
+            if identifier.startswith('i-'):
+                instance_ids_by_ref[identifier] = identifier
+                continue
+            try:
+                instance_id = self.find_instance_id_by_label(identifier)
+            except Exception as e:
+                errors[identifier] = f"Failed to terminate AWS instance: {str(e)}"
+                continue
+            if instance_id is None:
+                errors[identifier] = (
+                    f"Failed to terminate AWS instance: No instance found with label '{identifier}'"
+                )
+            else:
+                instance_ids_by_ref[identifier] = instance_id
+
+        refs = list(instance_ids_by_ref)
+        for start in range(0, len(refs), TERMINATE_BATCH_SIZE):
+            batch = refs[start:start + TERMINATE_BATCH_SIZE]
+            errors.update(self._terminate_batch(batch, [instance_ids_by_ref[r] for r in batch]))
+
+        return errors
+
+    def _terminate_batch(self, refs, ids):
+        """Terminate up to TERMINATE_BATCH_SIZE resolved IDs in one call."""
         try:
-            response = self.ec2.describe_instances(
-                Filters=[
-                    {'Name': 'tag:gmab', 'Values': ['true']},
-                    {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
-                ]
-            )
+            self._delete_gmab_key_pairs(self._lookup_key_names(ids).values())
+            self.ec2.terminate_instances(InstanceIds=ids)
+            self._invalidate_instances()
+            return {}
+        except Exception:
+            return super().terminate_instances(refs)
+
+    def list_instances(self):
+        """
+        List all EC2 instances tagged with 'gmab', always live. The result is
+        recorded for lookup_instances().
+        """
+        instances = self._describe_gmab_instances()
+        cache_put(CACHE_NAMESPACE, self._cache_key("instances"), instances)
+        return instances
 
+    def lookup_instances(self):
+        """
+        Like list_instances(), but reuses a listing from the last
+        LIST_CACHE_TTL seconds; see `gmab cache clear`.
+        """
+        return self._cached("instances", LIST_CACHE_TTL, self._describe_gmab_instances)
+
+    def _iter_gmab_reservations(self):
+        """
+        Yield the reservations of all gmab-tagged, non-terminated instances,
+        page by page, so large accounts aren't fetched in one giant response.
+        """
+        paginator = self.ec2.get_paginator('describe_instances')
+        pages = paginator.paginate(
+            Filters=_GMAB_INSTANCE_FILTERS,
+            PaginationConfig={'PageSize': LIST_PAGE_SIZE}
+        )
+        for page in pages:
+            yield from page['Reservations']
+
+    def _describe_gmab_instances(self):
+        try:
             instances = []
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    name_tag = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'Unknown')
-                    creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(instance)
-                    
-                    # Modify status to include expiry information
-                    base_status = instance['State']['Name']
-                    status = f"{base_status} (expired)" if is_expired else base_status
-
-                    instances.append({
-                        "provider": self.provider_name,
-                        "instance_id": instance['InstanceId'],
-                        "label": name_tag,
-                        "ip": instance.get('PublicIpAddress', 'No IP Assigned'),
-                        "status": status,
-                        "region": instance['Placement']['AvailabilityZone'][:-1],
-                        "image": instance['ImageId'],
-                        "creation_time": creation_time,
-                        "lifetime_minutes": lifetime_minutes,
-                        "is_expired": is_expired
-                    })
+            now = int(time.time())
+            for instance in chain.from_iterable(
+                reservation['Instances'] for reservation in self._iter_gmab_reservations()
+            ):
+                self._key_names[instance['InstanceId']] = instance.get('KeyName')
+                # Build the tag dict once; it serves both the Name and the expiry tags.
+                tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', ())}
+                creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(tags, now)
+
+                # Modify status to include expiry information
+                base_status = instance['State']['Name']
+                status = f"{base_status} (expired)" if is_expired else base_status
+
+                instances.append({
+                    "provider": self.provider_name,
+                    "instance_id": instance['InstanceId'],
+                    "label": tags.get('Name', 'Unknown'),
+                    "ip": instance.get('PublicIpAddress', 'No IP Assigned'),
+                    "status": status,
+                    "region": instance['Placement']['AvailabilityZone'][:-1],
+                    "image": instance['ImageId'],
+                    "creation_time": creation_time,
+                    "lifetime_minutes": lifetime_minutes,
+                    "is_expired": is_expired
+                })
 
             return instances
 
         except Exception as e:
-            raise Exception(f"Failed to list AWS instances: {str(e)}")
+            raise Exception(f"Failed to list AWS instances: {str(e)}") from e
 
     def list_expired_instances(self):
         """List all expired instances."""
@@ -403,7 +690,7 @@ class AWSProvider(ProviderBase):
                     return instance
             return {}
         except Exception as e:
-            raise Exception(f"Failed to get AWS instance details: {str(e)}")
+            raise Exception(f"Failed to get AWS instance details: {str(e)}") from e
 
     def detail_extras(self, raw):
         placement = raw.get('Placement', {}) or {}
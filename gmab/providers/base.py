@@ -3,11 +3,28 @@
 import functools
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
+# Upper bound on concurrent spawn_instance() calls in spawn_instances().
+SPAWN_WORKERS = 5
+
+
+@functools.lru_cache(maxsize=4)
+def _read_key_file(keyfile):
+    """
+    Read and strip a public key file. Cached per path for the life of the
+    process, so spawning several boxes reads the key once; a missing file
+    raises (and, being an exception, is not cached).
+    """
+    try:
+        return keyfile.read_text().strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SSH key not found at {keyfile}") from None
+
 
 @dataclass
 class ConfigField:
@@ -50,6 +67,11 @@ class ProviderBase(ABC):
     # Declarative configuration surface. Subclasses must override.
     CONFIG_SCHEMA = []
 
+    # Prefixes that make an instance ID unambiguously this provider's (e.g.
+    # AWS "i-"). Leave empty when native IDs are bare numbers or otherwise
+    # indistinguishable; `terminate` then has to ask the provider.
+    ID_PREFIXES = ()
+
     def __init__(self, provider_cfg):
         """
         Initialize the provider with configuration.
@@ -108,9 +130,15 @@ class ProviderBase(ABC):
     # --- Shared lifecycle helpers -------------------------------------------
 
     @staticmethod
-    def is_expired(creation_time, lifetime_minutes):
-        """Return True if an instance created at creation_time has outlived its lifetime."""
-        return (int(time.time()) - int(creation_time)) > (int(lifetime_minutes) * 60)
+    def is_expired(creation_time, lifetime_minutes, now=None):
+        """
+        Return True if an instance created at creation_time has outlived its
+        lifetime. Pass `now` (int unix time) when checking many instances so
+        the clock is read once per listing rather than once per instance.
+        """
+        if now is None:
+            now = int(time.time())
+        return (now - int(creation_time)) > (int(lifetime_minutes) * 60)
 
     def _read_ssh_key(self, ssh_key_path=None):
         """
@@ -121,11 +149,7 @@ class ProviderBase(ABC):
             FileNotFoundError: If the key file does not exist.
         """
         ssh_key_path = ssh_key_path or self.provider_cfg.get("ssh_key_path", "~/.ssh/id_ed25519.pub")
-        keyfile = Path(ssh_key_path).expanduser()
-        if not keyfile.exists():
-            raise FileNotFoundError(f"SSH key not found at {keyfile}")
-        with open(keyfile, 'r') as f:
-            return f.read().strip()
+        return _read_key_file(Path(ssh_key_path).expanduser())
 
     def find_instance_id_by_label(self, label):
         """
@@ -140,14 +164,69 @@ class ProviderBase(ABC):
                 return instance["instance_id"]
         return None
 
+    def lookup_instances(self):
+        """
+        Listing used to resolve terminate targets (labels, `terminate all`).
+        Defaults to list_instances(); providers may answer it from a
+        short-lived cache so a terminate right after `gmab list` doesn't list
+        again. User-facing listings always call list_instances().
+        """
+        return self.list_instances()
+
+    def spawn_instances(self, count, **spawn_kwargs):
+        """
+        Spawn `count` instances with the same settings. Each one is a
+        spawn_instance() call; they run concurrently (up to SPAWN_WORKERS at a
+        time) since each is mostly waiting on the provider's API.
+
+        Args:
+            count (int): Number of instances to spawn
+            **spawn_kwargs: Passed to every spawn_instance() call
+
+        Returns:
+            tuple: (instances, errors) - the spawned instance dicts in
+                submission order, and an error message per failed spawn.
+        """
+        instances, errors = [], []
+        with ThreadPoolExecutor(max_workers=max(1, min(count, SPAWN_WORKERS))) as pool:
+            futures = [pool.submit(self.spawn_instance, **spawn_kwargs) for _ in range(count)]
+            for future in futures:
+                try:
+                    instances.append(future.result())
+                except Exception as e:
+                    errors.append(str(e))
+        return instances, errors
+
+    def terminate_instances(self, instance_ids):
+        """
+        Terminate several instances at once, used by `terminate all|expired`.
+        The default issues one terminate_instance() call per ID; providers with
+        a bulk delete API (e.g. AWS) override this to make a single request.
+
+        Args:
+            instance_ids (list): Instance IDs or labels to terminate
+
+        Returns:
+            dict: {instance_id: error message} for every ID that could not be
+                terminated; empty when all of them were.
+        """
+        errors = {}
+        for instance_id in instance_ids:
+            try:
+                self.terminate_instance(instance_id)
+            except Exception as e:
+                errors[instance_id] = str(e)
+        return errors
+
     @classmethod
     def claims_identifier(cls, identifier):
         """
         Return True if the given instance identifier is unambiguously this
         provider's native ID format (e.g. AWS "i-..."). Used by `terminate` as a
-        fast path to skip querying every provider. Defaults to False.
+        fast path to skip querying every provider. Defaults to matching
+        ID_PREFIXES, so most providers only need to set that.
         """
-        return False
+        return bool(cls.ID_PREFIXES) and identifier.startswith(cls.ID_PREFIXES)
 
     def ssh_user(self, image=None):
         """
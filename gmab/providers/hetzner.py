@@ -1,9 +1,29 @@
 # gmab/providers/hetzner.py
 
+import hashlib
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from gmab.providers.base import ProviderBase, ConfigField
+from gmab.utils.api_cache import cache_get, cache_put, cache_invalidate
 from gmab.utils.naming import make_label
+from gmab.utils.http import new_session, default_retry, decode_json, encode_json, POOL_SIZE
+
+# One keep-alive session for every call to the API, across provider instances.
+# Transient 429/5xx answers are retried with backoff before reaching our checks.
+_SESSION = new_session(retry=default_retry())
+
+CACHE_NAMESPACE = "hetzner"
+# SSH key IDs are stable once uploaded; remembering them spares every spawn a
+# GET /ssh_keys. A key deleted in the console meanwhile fails one spawn, which
+# drops the entry so the next spawn looks it up again.
+SSH_KEY_CACHE_TTL = 24 * 60 * 60
+
+# Query for GET /servers: only servers gmab created, as many per page as the
+# API allows. Pages past the first are fetched concurrently.
+LIST_PAGE_SIZE = 50
+_GMAB_SERVERS_PARAMS = {"label_selector": "gmab", "per_page": LIST_PAGE_SIZE}
 
 class HetznerProvider(ProviderBase):
     """
@@ -22,6 +42,10 @@ class HetznerProvider(ProviderBase):
         ConfigField("default_type", "Default instance type", default="cpx22"),
     ]
 
+    # Seconds a listing is reused within the process, so a label lookup or an
+    # expiry check right after a list doesn't GET /servers again.
+    list_cache_ttl = 3.0
+
     def __init__(self, provider_cfg):
         """
         Initialize the Hetzner provider with the given configuration.
@@ -42,29 +66,63 @@ class HetznerProvider(ProviderBase):
             "Content-Type": "application/json"
         }
 
-    def _get_instance_expiry_info(self, labels):
+        # Static part of every POST /servers body; spawn_instance() copies it
+        # and fills in the per-server fields.
+        self._server_body_template = {
+            "server_type": self.provider_cfg.get("default_type", "cpx22"),
+            "image": self.provider_cfg.get("default_image", "ubuntu-22.04"),
+            "location": self.provider_cfg.get("default_region", "nbg1"),
+            "labels": {"gmab": "true"},
+        }
+
+        # (monotonic time, instances, {label: instance_id}) of the last
+        # listing; see list_instances().
+        self._list_cache = (0.0, None, None)
+        self._list_cache_lock = threading.Lock()
+
+    def invalidate_list_cache(self):
+        """Forget the memoized listing (after this provider spawns a server)."""
+        self._list_cache = (0.0, None, None)
+
+    def _forget_instance(self, instance_id):
+        """
+        Drop a deleted server from the memoized listing. The rest of it stays
+        valid, so terminating several boxes by label one after another still
+        costs a single GET /servers.
+        """
+        with self._list_cache_lock:
+            listed_at, cached, label_index = self._list_cache
+            if cached is None:
+                return
+            self._list_cache = (
+                listed_at,
+                [inst for inst in cached if inst["instance_id"] != instance_id],
+                {label: iid for label, iid in label_index.items() if iid != instance_id},
+            )
+
+    def _get_instance_expiry_info(self, labels, now=None):
         """
         Helper method to get expiry information from instance labels.
         
         Args:
             labels (dict): Key-value labels from the Hetzner instance
+            now (int, optional): Current unix time, read once per listing
             
         Returns:
             tuple: (creation_time, lifetime_minutes, is_expired)
         """
-        creation_time = 0
-        lifetime_minutes = 60
-        
         # In Hetzner, we store these as gmab-creation-time and gmab-lifetime
         creation_time = int(labels.get("gmab-creation-time", "0"))
         lifetime_minutes = int(labels.get("gmab-lifetime", "60"))
 
-        is_expired = self.is_expired(creation_time, lifetime_minutes)
+        is_expired = self.is_expired(creation_time, lifetime_minutes, now)
         return creation_time, lifetime_minutes, is_expired
 
     def _get_or_create_ssh_key(self, ssh_key_content):
         """
-        Helper method to get existing SSH key or create a new one.
+        Helper method to get existing SSH key or create a new one. The ID is
+        cached on disk (see SSH_KEY_CACHE_TTL), so repeated spawns with the
+        same key skip the lookup.
         
         Args:
             ssh_key_content (str): The SSH public key content
@@ -75,9 +133,26 @@ class HetznerProvider(ProviderBase):
         Raises:
             Exception: If SSH key cannot be created or found
         """
+        cache_key = self._ssh_key_cache_key(ssh_key_content)
+        cached_id = cache_get(CACHE_NAMESPACE, cache_key, SSH_KEY_CACHE_TTL)
+        if cached_id is not None:
+            return cached_id
+
+        key_id = self._find_or_upload_ssh_key(ssh_key_content)
+        cache_put(CACHE_NAMESPACE, cache_key, key_id)
+        return key_id
+
+    def _ssh_key_cache_key(self, ssh_key_content):
+        # Scoped to the API token (hashed), since key IDs are per project.
+        token = hashlib.sha256(self.provider_cfg.get("api_key", "").encode()).hexdigest()[:12]
+        key = hashlib.sha256(ssh_key_content.strip().encode()).hexdigest()[:16]
+        return f"{token}:ssh_key:{key}"
+
+    def _find_or_upload_ssh_key(self, ssh_key_content):
+        """Look the key up in the project (GET /ssh_keys), uploading it if absent."""
         try:
             # First list existing SSH keys
-            list_response = requests.get(
+            list_response = _SESSION.get(
                 f"{self.api_url}/ssh_keys",
                 headers=self.headers,
                 timeout=30
@@ -87,27 +162,27 @@ class HetznerProvider(ProviderBase):
                 raise Exception(f"Failed to list SSH keys: {list_response.text}")
                 
             # Check if we have a matching key
-            ssh_keys = list_response.json()["ssh_keys"]
+            ssh_keys = decode_json(list_response)["ssh_keys"]
             for key in ssh_keys:
                 if key["public_key"].strip() == ssh_key_content.strip():
                     return key["id"]
             
             # If no matching key found, create new one
             ssh_key_name = make_label(prefix="gmab-key", length=8)
-            create_response = requests.post(
+            create_response = _SESSION.post(
                 f"{self.api_url}/ssh_keys",
                 headers=self.headers,
-                json={
+                data=encode_json({
                     "name": ssh_key_name,
                     "public_key": ssh_key_content
-                },
+                }),
                 timeout=30
             )
 
             if create_response.status_code != 201:
                 raise Exception(f"Failed to create SSH key: {create_response.text}")
 
-            return create_response.json()["ssh_key"]["id"]
+            return decode_json(create_response)["ssh_key"]["id"]
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when managing SSH keys: {str(e)}")
@@ -132,14 +207,10 @@ class HetznerProvider(ProviderBase):
             FileNotFoundError: If SSH key file doesn't exist
             Exception: For API errors or other failures
         """
-        # Use provided values or fall back to defaults
-        default_type = self.provider_cfg.get("default_type", "cpx22")
-        default_image = self.provider_cfg.get("default_image", "ubuntu-22.04")
-        default_region = self.provider_cfg.get("default_region", "nbg1")
+        template = self._server_body_template
+        chosen_image = image or template["image"]
+        chosen_region = region or template["location"]
 
-        chosen_image = image or default_image
-        chosen_region = region or default_region
-        
         if lifetime_minutes is None:
             lifetime_minutes = 60
 
@@ -157,28 +228,32 @@ class HetznerProvider(ProviderBase):
             ssh_key_id = self._get_or_create_ssh_key(ssh_key_content)
 
             # Create the server with Hetzner-compliant labels
-            create_response = requests.post(
+            body = {
+                **template,
+                "name": instance_name,
+                "image": chosen_image,
+                "location": chosen_region,
+                "ssh_keys": [ssh_key_id],
+                "labels": {
+                    **template["labels"],
+                    "gmab-creation-time": str(creation_time),
+                    "gmab-lifetime": str(lifetime_minutes)
+                }
+            }
+            create_response = _SESSION.post(
                 f"{self.api_url}/servers",
                 headers=self.headers,
-                json={
-                    "name": instance_name,
-                    "server_type": default_type,
-                    "image": chosen_image,
-                    "location": chosen_region,
-                    "ssh_keys": [ssh_key_id],
-                    "labels": {
-                        "gmab": "true",
-                        "gmab-creation-time": str(creation_time),
-                        "gmab-lifetime": str(lifetime_minutes)
-                    }
-                },
+                data=encode_json(body),
                 timeout=60  # Server creation can take a bit longer
             )
 
             if create_response.status_code != 201:
+                # The cached key ID may be stale (key deleted in the console).
+                cache_invalidate(CACHE_NAMESPACE, self._ssh_key_cache_key(ssh_key_content))
                 raise Exception(f"Failed to create server: {create_response.text}")
 
-            server_data = create_response.json()["server"]
+            server_data = decode_json(create_response)["server"]
+            self.invalidate_list_cache()
             
             return {
                 "provider": self.provider_name,
@@ -197,6 +272,17 @@ class HetznerProvider(ProviderBase):
         except Exception as e:
             raise Exception(f"Failed to create Hetzner instance: {str(e)}")
 
+    def spawn_instances(self, count, **spawn_kwargs):
+        """
+        Spawn several servers concurrently (see ProviderBase.spawn_instances).
+        The SSH key is resolved (and uploaded if new) once up front: parallel
+        spawns would otherwise all miss the cache and race to upload the same
+        key, which Hetzner rejects as a duplicate for all but one of them.
+        """
+        if count > 1:
+            self._get_or_create_ssh_key(self._read_ssh_key(spawn_kwargs.get("ssh_key_path")))
+        return super().spawn_instances(count, **spawn_kwargs)
+
     def terminate_instance(self, instance_identifier):
         """
         Terminate a Hetzner server by ID or label.
@@ -217,7 +303,7 @@ class HetznerProvider(ProviderBase):
                 instance_id = instance_identifier
 
             # Delete the server
-            delete_response = requests.delete(
+            delete_response = _SESSION.delete(
                 f"{self.api_url}/servers/{instance_id}",
                 headers=self.headers,
                 timeout=30
@@ -225,36 +311,89 @@ class HetznerProvider(ProviderBase):
 
             if delete_response.status_code not in (200, 204):
                 raise Exception(f"Failed to delete server: {delete_response.text}")
+            self._forget_instance(str(instance_id))
                 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when terminating server: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to terminate Hetzner instance: {str(e)}")
 
+    def terminate_instances(self, instance_ids):
+        """
+        Terminate several servers. Hetzner has no bulk delete, so the DELETEs
+        are issued concurrently over the shared connection pool, and labels
+        are resolved with a single listing rather than one per label.
+
+        Returns:
+            dict: {instance_id: error message} for every ID that could not be
+                terminated; empty when all of them were.
+        """
+        errors = {}
+        targets = {}  # identifier as given -> numeric server ID
+        labels = [i for i in instance_ids if not i.isdigit()]
+        if labels:
+            try:
+                ids_by_label = self._listing()[1]
+            except Exception as e:
+                ids_by_label = {}
+                for label in labels:
+                    errors[label] = f"Failed to terminate Hetzner instance: {str(e)}"
+            for label in labels:
+                if label in errors:
+                    continue
+                if label in ids_by_label:
+                    targets[label] = ids_by_label[label]
+                else:
+                    errors[label] = (
+                        f"Failed to terminate Hetzner instance: No instance found with label '{label}'"
+                    )
+        targets.update((i, i) for i in instance_ids if i.isdigit())
+
+        if not targets:
+            return errors
+        with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(targets))) as pool:
+            futures = {
+                identifier: pool.submit(self.terminate_instance, server_id)
+                for identifier, server_id in targets.items()
+            }
+            for identifier, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[identifier] = str(e)
+        return errors
+
     def list_instances(self):
         """
         List all Hetzner servers tagged with 'gmab'.
         
+        A listing from the last `list_cache_ttl` seconds is reused.
+
         Returns:
             list: List of instance dictionaries
             
         Raises:
             Exception: If listing servers fails
         """
-        try:
-            response = requests.get(
-                f"{self.api_url}/servers",
-                headers=self.headers,
-                params={"label_selector": "gmab"},
-                timeout=30
-            )
+        return list(self._listing()[0])
+
+    def find_instance_id_by_label(self, label):
+        """Find a server ID by label via the memoized listing's label index."""
+        return self._listing()[1].get(label)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to list servers: {response.text}")
+    def _listing(self):
+        """Return (instances, {label: instance_id}), memoized for list_cache_ttl."""
+        listed_at, cached, label_index = self._list_cache
+        if cached is not None and time.monotonic() - listed_at < self.list_cache_ttl:
+            return cached, label_index
 
+        try:
             instances = []
-            for server in response.json()["servers"]:
-                creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(server.get("labels", {}))
+            now = int(time.time())
+            for server in self._fetch_gmab_servers():
+                creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(
+                    server.get("labels", {}), now
+                )
                 
                 # Modify status to include expiry information
                 base_status = server["status"]
@@ -273,13 +412,52 @@ class HetznerProvider(ProviderBase):
                     "is_expired": is_expired
                 })
 
-            return instances
+            label_index = {inst["label"]: inst["instance_id"] for inst in instances}
+            self._list_cache = (time.monotonic(), instances, label_index)
+            return instances, label_index
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when listing servers: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to list Hetzner instances: {str(e)}")
 
+    def _fetch_servers_page(self, page):
+        """GET one page of gmab servers and return the decoded body."""
+        response = _SESSION.get(
+            f"{self.api_url}/servers",
+            headers=self.headers,
+            params={**_GMAB_SERVERS_PARAMS, "page": page},
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list servers: {response.text}")
+
+        return decode_json(response)
+
+    def _fetch_gmab_servers(self):
+        """
+        Fetch every gmab server across all pages of GET /servers.
+
+        The first page reports how many pages there are; the rest are then
+        fetched in parallel and appended in page order.
+
+        Returns:
+            list: Raw server objects from the API
+        """
+        first = self._fetch_servers_page(1)
+        servers = list(first["servers"])
+
+        pagination = (first.get("meta") or {}).get("pagination") or {}
+        last_page = pagination.get("last_page") or 1
+        if last_page > 1:
+            pages = range(2, last_page + 1)
+            with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(pages))) as pool:
+                for body in pool.map(self._fetch_servers_page, pages):
+                    servers.extend(body["servers"])
+
+        return servers
+
     def list_expired_instances(self):
         """
         List all expired instances.
@@ -292,14 +470,14 @@ class HetznerProvider(ProviderBase):
     def get_instance_details(self, instance_id):
         """Fetch the full Hetzner server object for the detail view."""
         try:
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"{self.api_url}/servers/{instance_id}",
                 headers=self.headers,
                 timeout=30,
             )
             if resp.status_code != 200:
                 raise Exception(f"Failed to get Hetzner server details: {resp.text}")
-            return resp.json().get("server", {})
+            return decode_json(resp).get("server", {})
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when fetching Hetzner details: {str(e)}")
 
@@ -1,9 +1,27 @@
 ﻿# gmab/providers/linode.py
 
+import json
+import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from gmab.providers.base import ProviderBase, ConfigField
 from gmab.utils.naming import make_label
+from gmab.utils.http import new_session, default_retry, decode_json, encode_json, POOL_SIZE
+
+# One keep-alive session for every call to the API, across provider instances.
+# Transient 429/5xx answers are retried with backoff before reaching our checks.
+_SESSION = new_session(retry=default_retry())
+
+# The listing asks the API for gmab-tagged Linodes only (X-Filter), with the
+# largest page size it allows.
+LIST_PAGE_SIZE = 500
+_GMAB_TAG_FILTER = json.dumps({"tags": "gmab"})
+
+# Expiry tags written at spawn: gmab-creation-time-<epoch>, gmab-lifetime-<minutes>.
+_EXPIRY_TAG_RE = re.compile(r"gmab-(creation-time|lifetime)-(\d+)$")
 
 class LinodeProvider(ProviderBase):
     """
@@ -20,6 +38,61 @@ class LinodeProvider(ProviderBase):
         ConfigField("default_root_pass", "Default root password", secret=True),
     ]
 
+    # Seconds a listing is reused within the process, so a label lookup or an
+    # expiry check right after a list doesn't GET /linode/instances again.
+    list_cache_ttl = 3.0
+
+    def __init__(self, provider_cfg):
+        super().__init__(provider_cfg)
+        # Static part of every create body; spawn_instance() copies it and
+        # fills in the per-instance fields.
+        self._instance_body_template = {
+            "type": provider_cfg.get("default_type", "g6-nanode-1"),
+            "image": provider_cfg.get("default_image", "linode/ubuntu22.04"),
+            "region": provider_cfg.get("default_region", "us-east"),
+            "root_pass": provider_cfg.get("default_root_pass", "ChangeMe123!"),
+        }
+
+        # (monotonic time, instances, {label: instance_id}) of the last
+        # listing; see list_instances().
+        self._list_cache = (0.0, None, None)
+        self._list_cache_lock = threading.Lock()
+
+    def invalidate_list_cache(self):
+        """Forget the memoized listing (after this provider spawns a Linode)."""
+        self._list_cache = (0.0, None, None)
+
+    def _forget_instance(self, instance_id):
+        """
+        Drop a deleted Linode from the memoized listing. The rest of it stays
+        valid, so terminating several boxes by label costs a single listing.
+        """
+        with self._list_cache_lock:
+            listed_at, cached, label_index = self._list_cache
+            if cached is None:
+                return
+            self._list_cache = (
+                listed_at,
+                [inst for inst in cached if inst["instance_id"] != instance_id],
+                {label: iid for label, iid in label_index.items() if iid != instance_id},
+            )
+
+    @cached_property
+    def headers(self):
+        """
+        Request headers for the Linode API, built once per provider.
+
+        Raises:
+            ValueError: If the API key is missing from the config
+        """
+        token = self.provider_cfg.get("api_key")
+        if not token:
+            raise ValueError("Linode API key not found in config.")
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}"
+        }
+
     def spawn_instance(self, image=None, region=None, ssh_key_path=None, lifetime_minutes=None):
         """
         Create a new Linode instance.
@@ -38,21 +111,16 @@ class LinodeProvider(ProviderBase):
             FileNotFoundError: If SSH key file doesn't exist
             Exception: For API errors or other failures
         """
-        token = self.provider_cfg.get("api_key")
-        if not token:
-            raise ValueError("Linode API key not found in config.")
+        headers = self.headers
 
         # Fallback to defaults if arguments are not provided
-        linode_type = self.provider_cfg.get("default_type", "g6-nanode-1")
-        default_image = self.provider_cfg.get("default_image", "linode/ubuntu22.04")
-        default_region = self.provider_cfg.get("default_region", "us-east")
-
+        template = self._instance_body_template
         if image is None:
-            print(f"[INFO] No image specified, falling back to default: {default_image}")
-            image = default_image
+            image = template["image"]
+            print(f"[INFO] No image specified, falling back to default: {image}")
         if region is None:
-            print(f"[INFO] No region specified, falling back to default: {default_region}")
-            region = default_region
+            region = template["region"]
+            print(f"[INFO] No region specified, falling back to default: {region}")
         
         # Set default lifetime if not specified
         if lifetime_minutes is None:
@@ -61,23 +129,16 @@ class LinodeProvider(ProviderBase):
         # Current timestamp for creation time
         creation_time = int(time.time())
 
-        root_pass = self.provider_cfg.get("default_root_pass", "ChangeMe123!")
         ssh_key = self._read_ssh_key(ssh_key_path)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}"
-        }
-
         # Generate a unique Linode name
         random_name = make_label()
 
         data = {
-            "type": linode_type,
+            **template,
             "region": region,
             "image": image,
             "authorized_keys": [ssh_key],
-            "root_pass": root_pass,
             "label": random_name,
             "tags": [
                 "gmab",
@@ -87,17 +148,18 @@ class LinodeProvider(ProviderBase):
         }
 
         try:
-            resp = requests.post(
+            resp = _SESSION.post(
                 "https://api.linode.com/v4/linode/instances",
                 headers=headers,
-                json=data,
+                data=encode_json(data),
                 timeout=30  # Added timeout for better error handling
             )
             
             if resp.status_code not in (200, 202):
                 raise Exception(f"Linode creation failed: {resp.text}")
 
-            instance_data = resp.json()
+            self.invalidate_list_cache()
+            instance_data = decode_json(resp)
             ip_address = instance_data["ipv4"][0] if instance_data["ipv4"] else "No IP Assigned"
             
             return {
@@ -127,11 +189,7 @@ class LinodeProvider(ProviderBase):
         Raises:
             Exception: If the instance cannot be found or deleted
         """
-        token = self.provider_cfg.get("api_key")
-        if not token:
-            raise ValueError("Linode API key not found in config.")
-            
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = self.headers
 
         if not instance_identifier.isdigit():
             instance_id = self.find_instance_id_by_label(instance_identifier)
@@ -141,7 +199,7 @@ class LinodeProvider(ProviderBase):
             instance_id = instance_identifier
 
         try:
-            resp = requests.delete(
+            resp = _SESSION.delete(
                 f"https://api.linode.com/v4/linode/instances/{instance_id}",
                 headers=headers,
                 timeout=30  # Added timeout for better error handling
@@ -149,66 +207,144 @@ class LinodeProvider(ProviderBase):
 
             if resp.status_code not in (200, 204):
                 raise Exception(f"Linode deletion failed: {resp.text}")
+            self._forget_instance(str(instance_id))
                 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when terminating Linode: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to terminate Linode instance: {str(e)}")
 
-    def _get_instance_expiry_info(self, tags):
+    def terminate_instances(self, instance_ids):
+        """
+        Terminate several Linodes. The API has no bulk delete, so the DELETEs
+        are issued concurrently over the shared connection pool (a 429 is
+        retried by the session), and labels are resolved with a single listing
+        rather than one per label.
+
+        Returns:
+            dict: {instance_id: error message} for every ID that could not be
+                terminated; empty when all of them were.
+        """
+        errors = {}
+        targets = {}  # identifier as given -> numeric Linode ID
+        labels = [i for i in instance_ids if not i.isdigit()]
+        if labels:
+            try:
+                ids_by_label = self._listing()[1]
+            except Exception as e:
+                ids_by_label = {}
+                for label in labels:
+                    errors[label] = f"Failed to terminate Linode instance: {str(e)}"
+            for label in labels:
+                if label in errors:
+                    continue
+                if label in ids_by_label:
+                    targets[label] = ids_by_label[label]
+                else:
+                    errors[label] = (
+                        f"Instance with label '{label}' not found or not tagged with 'gmab'."
+                    )
+        targets.update((i, i) for i in instance_ids if i.isdigit())
+
+        if not targets:
+            return errors
+        with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(targets))) as pool:
+            futures = {
+                identifier: pool.submit(self.terminate_instance, linode_id)
+                for identifier, linode_id in targets.items()
+            }
+            for identifier, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[identifier] = str(e)
+        return errors
+
+    def _get_instance_expiry_info(self, tags, now=None):
         """
         Helper method to get expiry information from instance tags.
         
         Args:
             tags (list): List of tags from the Linode instance
+            now (int, optional): Current unix time, read once per listing
             
         Returns:
             tuple: (creation_time, lifetime_minutes, is_expired)
         """
-        creation_time = 0
-        lifetime_minutes = 60
-        
+        values = {}
         for tag in tags:
-            if tag.startswith("gmab-creation-time-"):
-                creation_time = int(tag.split("-")[-1])
-            elif tag.startswith("gmab-lifetime-"):
-                lifetime_minutes = int(tag.split("-")[-1])
+            match = _EXPIRY_TAG_RE.match(tag)
+            if match:
+                values[match.group(1)] = int(match.group(2))
 
-        is_expired = self.is_expired(creation_time, lifetime_minutes)
+        creation_time = values.get("creation-time", 0)
+        lifetime_minutes = values.get("lifetime", 60)
+        is_expired = self.is_expired(creation_time, lifetime_minutes, now)
         return creation_time, lifetime_minutes, is_expired
 
     def list_instances(self):
         """
         Retrieve all active Linode instances that have the 'gmab' tag.
-        
+
+        A listing from the last `list_cache_ttl` seconds is reused.
+
         Returns:
             list: List of instance dictionaries
             
         Raises:
             Exception: If listing instances fails
         """
-        token = self.provider_cfg.get("api_key")
-        if not token:
-            raise ValueError("Linode API key not found in config.")
-            
-        headers = {"Authorization": f"Bearer {token}"}
+        return list(self._listing()[0])
+
+    def find_instance_id_by_label(self, label):
+        """
+        Find a gmab Linode's ID by label. Uses the memoized listing's label
+        index when there is one; otherwise asks the API for just that label
+        (an X-Filter query) instead of fetching every instance.
+
+        Returns:
+            str or None: The instance ID if a gmab Linode with that label exists.
+        """
+        memoized = self._memoized_listing()
+        if memoized is not None:
+            return memoized[1].get(label)
 
         try:
-            response = requests.get(
-                "https://api.linode.com/v4/linode/instances", 
-                headers=headers,
-                timeout=30  # Added timeout for better error handling
+            response = _SESSION.get(
+                "https://api.linode.com/v4/linode/instances",
+                headers={**self.headers, "X-Filter": json.dumps({"label": label, "tags": "gmab"})},
+                timeout=30
             )
-            
             if response.status_code != 200:
-                raise Exception(f"Failed to list Linodes: {response.text}")
+                raise Exception(f"Failed to look up Linode '{label}': {response.text}")
+            matches = decode_json(response)["data"]
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Network error when looking up Linode '{label}': {str(e)}")
+        return str(matches[0]["id"]) if matches else None
+
+    def _memoized_listing(self):
+        """(instances, label_index) from the last list_cache_ttl seconds, or None."""
+        listed_at, cached, label_index = self._list_cache
+        if cached is not None and time.monotonic() - listed_at < self.list_cache_ttl:
+            return cached, label_index
+        return None
 
-            instances = response.json()["data"]
+    def _listing(self):
+        """Return (instances, {label: instance_id}), memoized for list_cache_ttl."""
+        memoized = self._memoized_listing()
+        if memoized is not None:
+            return memoized
+
+        try:
+            instances = self._fetch_gmab_linodes()
             result = []
+            now = int(time.time())
 
             for instance in instances:
                 if "gmab" in instance.get("tags", []):
-                    creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(instance.get("tags", []))
+                    creation_time, lifetime_minutes, is_expired = self._get_instance_expiry_info(
+                        instance.get("tags", []), now
+                    )
                     
                     # Modify status to include expiry information
                     base_status = instance["status"]
@@ -227,13 +363,51 @@ class LinodeProvider(ProviderBase):
                         "is_expired": is_expired
                     })
 
-            return result
+            label_index = {inst["label"]: inst["instance_id"] for inst in result}
+            self._list_cache = (time.monotonic(), result, label_index)
+            return result, label_index
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when listing Linodes: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to list Linode instances: {str(e)}")
 
+    def _fetch_linodes_page(self, page):
+        """GET one page of gmab Linodes and return the decoded body."""
+        response = _SESSION.get(
+            "https://api.linode.com/v4/linode/instances",
+            headers={**self.headers, "X-Filter": _GMAB_TAG_FILTER},
+            params={"page": page, "page_size": LIST_PAGE_SIZE},
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list Linodes: {response.text}")
+
+        return decode_json(response)
+
+    def _fetch_gmab_linodes(self):
+        """
+        Fetch every gmab Linode across all pages of the listing.
+
+        The first page reports how many pages there are; the rest are then
+        fetched in parallel and appended in page order.
+
+        Returns:
+            list: Raw instance objects from the API
+        """
+        first = self._fetch_linodes_page(1)
+        instances = list(first["data"])
+
+        last_page = first.get("pages") or 1
+        if last_page > 1:
+            pages = range(2, last_page + 1)
+            with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(pages))) as pool:
+                for body in pool.map(self._fetch_linodes_page, pages):
+                    instances.extend(body["data"])
+
+        return instances
+
     def list_expired_instances(self):
         """
         List all expired instances.
@@ -245,19 +419,16 @@ class LinodeProvider(ProviderBase):
 
     def get_instance_details(self, instance_id):
         """Fetch the full Linode instance object for the detail view."""
-        token = self.provider_cfg.get("api_key")
-        if not token:
-            raise ValueError("Linode API key not found in config.")
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = self.headers
         try:
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"https://api.linode.com/v4/linode/instances/{instance_id}",
                 headers=headers,
                 timeout=30,
             )
             if resp.status_code != 200:
                 raise Exception(f"Failed to get Linode details: {resp.text}")
-            return resp.json()
+            return decode_json(resp)
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error when fetching Linode details: {str(e)}")
 
@@ -1,5 +1,6 @@
 # gmab/providers/ovh.py
 
+import threading
 import time
 
 import ovh
@@ -52,6 +53,11 @@ class OVHProvider(ProviderBase):
 
         self.service_name = provider_cfg["service_name"]
         self._image_name_cache = {}
+        # (region, public key) -> project SSH key id. The lock makes concurrent
+        # spawns (spawn --count) wait for one upload instead of each racing
+        # to create the same key.
+        self._ssh_key_ids = {}
+        self._ssh_key_lock = threading.Lock()
         self.client = ovh.Client(
             endpoint=provider_cfg.get("endpoint", "ovh-eu"),
             application_key=provider_cfg["application_key"],
@@ -131,6 +137,13 @@ class OVHProvider(ProviderBase):
 
     def _get_or_create_ssh_key(self, region, ssh_key_content):
         """Reuse an existing project SSH key matching the public key, else create one."""
+        cache_key = (region, ssh_key_content.strip())
+        with self._ssh_key_lock:
+            if cache_key not in self._ssh_key_ids:
+                self._ssh_key_ids[cache_key] = self._find_or_upload_ssh_key(region, ssh_key_content)
+            return self._ssh_key_ids[cache_key]
+
+    def _find_or_upload_ssh_key(self, region, ssh_key_content):
         try:
             keys = self.client.get(f"{self._base()}/sshkey", region=region)
             for key in keys:
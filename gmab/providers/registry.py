@@ -1,5 +1,6 @@
 # gmab/providers/registry.py
 
+import functools
 import importlib
 import pkgutil
 
@@ -32,9 +33,8 @@ def _all_subclasses(cls):
         yield from _all_subclasses(sub)
 
 
-def get_registry():
-    """Return a {name: provider_class} mapping of all registered providers."""
-    _discover()
+def _registered():
+    """Return {name: provider_class} for the provider modules imported so far."""
     return {
         sub.name: sub
         for sub in _all_subclasses(ProviderBase)
@@ -42,6 +42,102 @@ def get_registry():
     }
 
 
+def get_registry():
+    """Return a {name: provider_class} mapping of all registered providers."""
+    _discover()
+    return _registered()
+
+
+def get_provider_class(name):
+    """Return the provider class registered as `name`, or None if there is none.
+
+    Unlike get_registry(), this only imports what it has to: shipped providers
+    live in a module named after their registry key (gmab/providers/aws.py is
+    "aws"), so that module is tried first and the other SDKs stay unloaded. Full
+    discovery is the fallback for providers whose module is named differently.
+    """
+    cls = _registered().get(name)
+    if cls is not None:
+        return cls
+
+    if name and not name.startswith("_") and name not in _NON_PROVIDER_MODULES:
+        try:
+            importlib.import_module(f"{__package__}.{name}")
+        except ModuleNotFoundError as e:
+            # Only swallow "no such provider module"; a missing SDK inside an
+            # existing provider module must still surface.
+            if e.name != f"{__package__}.{name}":
+                raise
+        cls = _registered().get(name)
+        if cls is not None:
+            return cls
+
+    return get_registry().get(name)
+
+
+# Native ID prefixes of the shipped providers, keyed by registry name, so
+# get_identifier_owner() can name the owner of e.g. "i-..." without importing
+# every provider SDK. Must mirror each class's ID_PREFIXES (a test checks).
+_SHIPPED_ID_PREFIXES = {
+    "aws": ("i-",),
+    "hetzner": (),
+    "linode": (),
+    "ovh": (),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _identifier_index(provider_names):
+    """
+    Build the lookup tables for get_identifier_owner() from a tuple of provider
+    names: {prefix: name}, the distinct prefix lengths (longest first), and
+    the classes that override claims_identifier() with custom logic.
+
+    Shipped providers come from _SHIPPED_ID_PREFIXES; only other providers are
+    resolved (and so imported) through get_provider_class().
+    """
+    by_prefix = {}
+    custom = []
+    for name in provider_names:
+        if name in _SHIPPED_ID_PREFIXES:
+            prefixes = _SHIPPED_ID_PREFIXES[name]
+        else:
+            cls = get_provider_class(name)
+            if cls is None:
+                continue
+            prefixes = cls.ID_PREFIXES
+            if cls.claims_identifier.__func__ is not ProviderBase.claims_identifier.__func__:
+                custom.append(cls)
+        for prefix in prefixes:
+            by_prefix.setdefault(prefix, name)
+    lengths = sorted({len(prefix) for prefix in by_prefix}, reverse=True)
+    return by_prefix, lengths, tuple(custom)
+
+
+def get_identifier_owner(identifier, provider_names=None):
+    """Return the name of the provider whose native ID format `identifier`
+    matches (longest ID_PREFIXES match wins), or None if no provider claims it.
+
+    `provider_names` limits the candidates (e.g. to the configured providers);
+    by default every registered provider is considered, which imports them all.
+
+    This is a dict lookup per distinct prefix length rather than a
+    claims_identifier() call per provider; only providers that override
+    claims_identifier() themselves are still asked one by one.
+    """
+    if provider_names is None:
+        provider_names = get_registry()
+    by_prefix, lengths, custom = _identifier_index(tuple(provider_names))
+    for length in lengths:
+        name = by_prefix.get(identifier[:length])
+        if name is not None:
+            return name
+    for cls in custom:
+        if cls.claims_identifier(identifier):
+            return cls.name
+    return None
+
+
 def get_available_providers():
     """Return a sorted list of registered provider names."""
     return sorted(get_registry().keys())
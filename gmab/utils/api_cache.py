@@ -0,0 +1,110 @@
+# gmab/utils/api_cache.py
+#
+# A small persistent TTL cache for provider API lookups, stored as one JSON file
+# per namespace under the gmab cache directory. Meant for answers that change
+# rarely (AWS VPC/subnet/security group IDs) or that are fine to reuse for a
+# few seconds between back-to-back commands (instance listings). Everything in
+# here is disposable: `gmab cache clear` wipes it, and every read/write is best
+# effort, so a broken cache only ever costs an extra API call.
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from gmab.utils.paths import get_cache_dir
+
+# Serializes the load -> modify -> store cycle of cache_put/cache_invalidate,
+# which run from worker threads (parallel list, spawn --count, bulk terminate).
+_LOCK = threading.Lock()
+
+
+def _namespace_path(namespace):
+    return get_cache_dir() / f"{namespace}.json"
+
+
+def _load(namespace):
+    try:
+        with open(_namespace_path(namespace), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_atomic(path, data):
+    """
+    Write `data` as JSON to `path` via a uniquely named temp file in the same
+    directory and os.replace(), so readers never see a half-written file and
+    concurrent writers (threads or processes) never share a temp file.
+    Best effort: failing to write is not an error.
+    """
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.",
+            suffix=".tmp", delete=False,
+        ) as f:
+            tmp = f.name
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _store(namespace, data):
+    write_json_atomic(_namespace_path(namespace), data)
+
+
+def cache_get(namespace, key, ttl):
+    """
+    Return the value stored under `key` if it is younger than `ttl` seconds,
+    else None. (None is therefore never a meaningful cached value.)
+    """
+    entry = _load(namespace).get(key)
+    if not isinstance(entry, dict) or time.time() - entry.get("at", 0) > ttl:
+        return None
+    return entry.get("value")
+
+
+def cache_put(namespace, key, value):
+    """Store a JSON-serializable value under `key`, timestamped now."""
+    with _LOCK:
+        data = _load(namespace)
+        data[key] = {"at": time.time(), "value": value}
+        _store(namespace, data)
+
+
+def cache_invalidate(namespace, key):
+    """Drop one entry, e.g. an instance listing after a spawn or terminate."""
+    with _LOCK:
+        data = _load(namespace)
+        if data.pop(key, None) is not None:
+            _store(namespace, data)
+
+
+def clear_cache():
+    """
+    Delete every cache file (API lookups and the instance index).
+
+    Returns:
+        int: The number of files removed.
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir.is_dir():
+        return 0
+    removed = 0
+    for path in cache_dir.iterdir():
+        if path.is_file():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
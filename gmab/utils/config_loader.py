@@ -1,10 +1,17 @@
 ﻿# gmab/utils/config_loader.py
 
+import copy
+import functools
 import json
 import os
 from pathlib import Path
 from gmab.utils.paths import get_config_file_path, ensure_config_dir_exists
-from gmab.providers import get_registry
+
+try:
+    # Optional C-accelerated JSON (`pip install gmab[fast]`); stdlib json otherwise.
+    import orjson
+except ImportError:
+    orjson = None
 
 # Default configurations
 DEFAULT_GENERAL_CONFIG = {
@@ -16,8 +23,23 @@ DEFAULT_GENERAL_CONFIG = {
 
 def get_default_providers_config():
     """Build the default providers.json contents from the provider registry."""
+    # Imported here: the registry imports every provider SDK, which plain config
+    # loads (and therefore every CLI command) should not pay for.
+    from gmab.providers import get_registry
     return {name: cls.get_default_config() for name, cls in get_registry().items()}
 
+def dumps_config(config):
+    """Serialize a config dict as 2-space indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(config, indent=2)
+
+def _loads_config(text):
+    """Parse config JSON text. Both parsers raise json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 class ConfigNotFoundError(Exception):
     """Exception raised when a config file does not exist and should not be auto-created."""
     pass
@@ -49,8 +71,13 @@ def load_config(filename, create_if_missing=False):
     actual_filename = filename_map.get(filename, filename)
     config_path = get_config_file_path(actual_filename)
 
-    # Check if config exists
-    if not config_path.exists():
+    # Check if config exists (the stat result doubles as the parse-cache key)
+    try:
+        stat = config_path.stat()
+    except OSError:  # what Path.exists() treated as "missing"
+        stat = None
+
+    if stat is None:
         # If it doesn't exist and we shouldn't create it, raise an error
         if not create_if_missing:
             raise ConfigNotFoundError(
@@ -63,16 +90,31 @@ def load_config(filename, create_if_missing=False):
                          else get_default_providers_config())
         ensure_config_dir_exists()
         with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(default_content, f, indent=2)
+            f.write(dumps_config(default_content))
+        stat = config_path.stat()
 
     try:
-        with open(config_path, 'r', encoding='utf-8-sig') as f:
-            return json.load(f)
+        config = _read_config(str(config_path), stat.st_mtime_ns, stat.st_size)
     except json.JSONDecodeError as e:
         raise ValueError(f"Error parsing config file {config_path}: {str(e)}")
     except Exception as e:
         raise Exception(f"Error loading config from {config_path}: {str(e)}")
 
+    # Callers mutate what they get back (configure edits and re-saves it), so
+    # hand out a copy rather than the cached object itself.
+    return copy.deepcopy(config)
+
+@functools.lru_cache(maxsize=8)
+def _read_config(path, mtime_ns, size):
+    """
+    Parse a config file, memoized for the life of the process. A single command
+    loads config.json/providers.json several times; keying on the file's mtime
+    and size means only the first load hits the disk, while a file edited in
+    the meantime is still re-read.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return _loads_config(f.read())
+
 def config_exists():
     """Check if the basic configuration files exist.
     
@@ -88,4 +130,5 @@ def save_config(config, filename):
     config_path = get_config_file_path(filename)
     ensure_config_dir_exists()
     with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
\ No newline at end of file
+        f.write(dumps_config(config))
+    _read_config.cache_clear()
\ No newline at end of file
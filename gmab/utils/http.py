@@ -0,0 +1,145 @@
+# gmab/utils/http.py
+#
+# Shared HTTP plumbing for the REST-based providers (Linode, Hetzner).
+
+import json
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional C-accelerated JSON (`pip install gmab[fast]`); stdlib json otherwise.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Enough for list_boxes()/terminate to run a handful of calls to one API at once.
+POOL_SIZE = 10
+
+# Rate limiting and transient gateway/server errors; worth another try.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Only idempotent methods are retried after the server has seen the request:
+# replaying a POST that created a server (then failed with a 502) would create
+# a second one. Connection errors and 429s are retried for every method, since
+# those requests were never acted on.
+RETRY_METHODS = frozenset(["GET", "DELETE"])
+
+# Wall-clock budget for retrying one request, counted from its first failure,
+# and the longest single wait. During a long API outage a command gives up
+# after ~20s rather than stacking backoffs or a large Retry-After.
+RETRY_DEADLINE = 20.0
+RETRY_BACKOFF_CAP = 5.0
+
+
+class DeadlineRetry(Retry):
+    """
+    urllib3 Retry that also stops once `max_elapsed` seconds have passed since
+    the request first failed, and never sleeps past that point (backoff and
+    Retry-After alike are clipped to the time left). A 429 is retried for
+    every method, POST included: the API turned the request away without
+    acting on it, so sending it again cannot create a duplicate.
+    """
+
+    def __init__(self, *args, max_elapsed=RETRY_DEADLINE, deadline=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_elapsed = max_elapsed
+        self.deadline = deadline
+
+    def new(self, **kwargs):
+        # Retry objects are immutable; increment() calls new() on each failure,
+        # so the first copy made for a request is where its deadline starts.
+        deadline = self.deadline
+        if deadline is None:
+            deadline = time.monotonic() + self.max_elapsed
+        kwargs.setdefault("max_elapsed", self.max_elapsed)
+        kwargs.setdefault("deadline", deadline)
+        return super().new(**kwargs)
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def _time_left(self):
+        if self.deadline is None:
+            return self.max_elapsed
+        return max(0.0, self.deadline - time.monotonic())
+
+    def is_exhausted(self):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        return super().is_exhausted()
+
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), RETRY_BACKOFF_CAP, self._time_left())
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self._time_left())
+
+
+def default_retry():
+    """
+    The retry policy for provider APIs: up to 5 attempts with exponential
+    backoff (0.5s, 1s, 2s, ... capped at RETRY_BACKOFF_CAP) plus jitter,
+    honouring Retry-After on 429/503, all within RETRY_DEADLINE seconds.
+    Once retries run out the last response is returned as-is, so providers
+    still report the API's own error text.
+    """
+    options = dict(
+        total=5,
+        connect=3,
+        read=3,
+        status=5,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return DeadlineRetry(backoff_jitter=0.3, **options)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_jitter; plain exponential backoff then.
+        return DeadlineRetry(**options)
+
+
+def new_session(retry=None):
+    """
+    Build a requests.Session with a keep-alive connection pool mounted for
+    https://. Provider modules hold one for their API, so consecutive calls
+    (list, then a DELETE per instance, ...) reuse the open TCP+TLS connection
+    instead of paying a fresh handshake each time.
+
+    Args:
+        retry (urllib3 Retry, optional): Retry policy for the adapter, e.g.
+            default_retry(). None keeps requests' default of no retries.
+    """
+    session = requests.Session()
+    adapter_options = {"pool_connections": POOL_SIZE, "pool_maxsize": POOL_SIZE}
+    if retry is not None:
+        adapter_options["max_retries"] = retry
+    session.mount("https://", HTTPAdapter(**adapter_options))
+    return session
+
+
+def decode_json(response):
+    """Parse a response body as JSON (orjson when installed, like response.json())."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def encode_json(payload):
+    """
+    Serialize a request body to JSON bytes, for `data=` on calls that already
+    send a `Content-Type: application/json` header.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
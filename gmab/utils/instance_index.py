@@ -0,0 +1,66 @@
+# gmab/utils/instance_index.py
+#
+# A short-lived on-disk index of which provider owns which instance, written by
+# `gmab list` and read by `gmab terminate <id|label>`. Without it, terminating
+# by label (or by a numeric ID no provider can claim) lists every configured
+# provider just to find the owner; with a fresh index it's a dict lookup.
+
+import json
+import time
+
+from gmab.utils.api_cache import write_json_atomic
+from gmab.utils.paths import get_cache_dir
+
+INDEX_FILENAME = "instance_index.json"
+
+# Instances come and go within minutes/hours; past this the index is ignored.
+INDEX_TTL_SECONDS = 300
+
+
+def _index_path():
+    return get_cache_dir() / INDEX_FILENAME
+
+
+def save_instance_index(instances):
+    """
+    Record the owning provider and native ID of each instance dict, keyed by
+    both instance_id and label. Best effort: failing to write is not an error.
+
+    A key that names two different instances (Linode and Hetzner both use bare
+    numeric IDs) is stored as ambiguous (null), so lookups fall back to
+    scanning the providers rather than guessing one.
+    """
+    entries = {}
+    for instance in instances:
+        entry = [instance["provider"], instance["instance_id"]]
+        for key in (instance["instance_id"], instance["label"]):
+            if key in entries and entries[key] != entry:
+                entries[key] = None
+            else:
+                entries[key] = entry
+    write_json_atomic(_index_path(), {"created_at": time.time(), "instances": entries})
+
+
+def lookup_instance(identifier):
+    """
+    Return (provider_name, instance_id) for an instance ID or label from a
+    fresh index, or None when there's no index, it has expired, or the
+    identifier isn't in it.
+    """
+    try:
+        with open(_index_path(), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - index.get("created_at", 0) > INDEX_TTL_SECONDS:
+        return None
+    entry = index.get("instances", {}).get(identifier)
+    return tuple(entry) if entry else None
+
+
+def invalidate_instance_index():
+    """Drop the index, e.g. after a terminate made some of its entries stale."""
+    try:
+        _index_path().unlink()
+    except OSError:
+        pass
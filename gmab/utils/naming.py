@@ -1,12 +1,18 @@
 # gmab/utils/naming.py
 
-import random
-import string
+import base64
+import secrets
 
 def generate_random_string(length=12):
-    """Generate a random string of lowercase letters and digits."""
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    """
+    Generate a random string of lowercase letters and digits.
+
+    Base32-encodes CSPRNG bytes (one call, no per-character loop), so the
+    alphabet is a-z plus 2-7: 5 bits of entropy per character.
+    """
+    raw = secrets.token_bytes((length * 5 + 7) // 8)
+    return base64.b32encode(raw).decode('ascii').lower()[:length]
 
 def make_label(prefix="gmab", length=12):
-    """Generate a unique gmab instance label, e.g. 'gmab-3ul7u0p1x9ns'."""
+    """Generate a unique gmab instance label, e.g. 'gmab-3ul7u2p4x6ns'."""
     return f"{prefix}-{generate_random_string(length)}"
@@ -41,6 +41,16 @@ def get_config_file_path(filename):
     config_dir = get_config_dir()
     return config_dir / filename
 
+def get_cache_dir():
+    """
+    Get the directory for gmab's disposable cache files. It lives inside the
+    config directory so GMAB_CONFIG_DIR relocates (and isolates) it as well.
+
+    Returns:
+        Path: Path object representing the cache directory
+    """
+    return get_config_dir() / 'cache'
+
 def ensure_config_dir_exists():
     """
     Create the config directory if it doesn't exist.
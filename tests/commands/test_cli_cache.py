@@ -0,0 +1,20 @@
+import unittest
+
+from click.testing import CliRunner
+
+from gmab.cli import cli
+from gmab.utils.api_cache import cache_put, cache_get
+from tests.support.config_env import ConfigDirTestCase
+
+
+class TestCliCacheClear(ConfigDirTestCase):
+    def test_clear_reports_and_removes(self):
+        cache_put("aws", "vpc", "vpc-1")
+        result = CliRunner().invoke(cli, ["cache", "clear"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Cleared 1 cache file(s).", result.output)
+        self.assertIsNone(cache_get("aws", "vpc", ttl=60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from gmab.cli import cli
+
+
+class TestCliCompletion(unittest.TestCase):
+    def test_prints_bash_script(self):
+        result = CliRunner().invoke(cli, ["completion", "bash"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("_GMAB_COMPLETE=bash_complete", result.output)
+
+    def test_install_writes_script_under_home(self):
+        home = tempfile.mkdtemp(prefix="gmab-home-")
+        self.addCleanup(shutil.rmtree, home, ignore_errors=True)
+        with patch.dict(os.environ, {"HOME": home}):
+            result = CliRunner().invoke(cli, ["completion", "fish", "--install"])
+        self.assertEqual(result.exit_code, 0)
+        path = os.path.join(home, ".config", "fish", "completions", "gmab.fish")
+        with open(path) as f:
+            self.assertIn("_GMAB_COMPLETE=fish_complete", f.read())
+
+    def test_unknown_shell_rejected(self):
+        result = CliRunner().invoke(cli, ["completion", "tcsh"])
+        self.assertNotEqual(result.exit_code, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,10 +3,14 @@ import os
 import unittest
 from unittest.mock import patch, MagicMock
 
+import click
 from click.testing import CliRunner
 
-from gmab.cli import cli, select_list_columns, _flatten
+from gmab.cli import (
+    cli, select_list_columns, _flatten, get_configured_providers, check_config_exists, LazyChoice,
+)
 from gmab.commands.list import get_detailed_instances
+from tests.support.config_env import ConfigDirTestCase
 
 
 class TestSelectListColumns(unittest.TestCase):
@@ -56,7 +60,7 @@ class TestListRendersTable(unittest.TestCase):
         with patch.dict(os.environ, {"COLUMNS": "200"}), \
              patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.list_boxes", return_value=self.SAMPLE):
+             patch("gmab.commands.list.list_boxes", return_value=self.SAMPLE):
             result = CliRunner().invoke(cli, ["list"])
         self.assertEqual(result.exit_code, 0)
         # The full label (terminate handle) and provider appear in the rendered table.
@@ -67,11 +71,51 @@ class TestListRendersTable(unittest.TestCase):
     def test_empty_list_message(self):
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.list_boxes", return_value=[]):
+             patch("gmab.commands.list.list_boxes", return_value=[]):
             result = CliRunner().invoke(cli, ["list"])
         self.assertIn("No active instances found.", result.output)
 
 
+class TestGetConfiguredProviders(ConfigDirTestCase):
+    def test_returns_configured_names_as_set(self):
+        self.write_configs(providers={"linode": {"api_key": "a"}, "ovh": {}})
+        self.assertEqual(get_configured_providers(), frozenset({"linode", "ovh"}))
+
+    def test_missing_config_is_empty(self):
+        self.assertEqual(get_configured_providers(), frozenset())
+
+
+class TestCheckConfigExists(ConfigDirTestCase):
+    def test_missing_then_configured(self):
+        with patch("gmab.cli.click.echo"):
+            self.assertFalse(check_config_exists())
+        self.write_configs(general={}, providers={})
+        self.assertTrue(check_config_exists())
+
+    def test_positive_result_is_remembered(self):
+        self.write_configs(general={}, providers={})
+        self.assertTrue(check_config_exists())
+        with patch("gmab.cli.config_exists") as exists:
+            self.assertTrue(check_config_exists())
+        exists.assert_not_called()
+
+
+class TestLazyChoice(unittest.TestCase):
+    def test_choices_resolved_on_first_use_only(self):
+        source = MagicMock(return_value=["all", "linode"])
+        choice = LazyChoice(source)
+        source.assert_not_called()
+        self.assertEqual(choice.convert("linode", None, None), "linode")
+        choice.convert("all", None, None)
+        source.assert_called_once()
+
+    def test_behaves_like_a_click_choice(self):
+        choice = LazyChoice(lambda: ["all", "linode"], case_sensitive=False)
+        self.assertEqual(choice.convert("LINODE", None, None), "linode")
+        self.assertEqual(choice.to_info_dict()["choices"], ["all", "linode"])
+        self.assertIn("linode", choice.get_metavar(click.Option(["-p"])))
+
+
 class TestFlatten(unittest.TestCase):
     def test_flatten_nested_dict_and_list(self):
         out = _flatten({"a": {"b": 1}, "c": [10, 20], "d": [], "e": {}})
@@ -94,11 +138,33 @@ class TestListDetailGrammar(unittest.TestCase):
     def _run(self, argv):
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.get_detailed_instances", return_value=[self.SAMPLE]) as gdi, \
+             patch("gmab.commands.list.get_detailed_instances", return_value=[self.SAMPLE]) as gdi, \
              patch("gmab.cli.render_instance_detail") as rid:
             result = CliRunner().invoke(cli, argv)
         return result, gdi, rid
 
+    def test_detail_tables_written_in_one_batch(self):
+        writes = []
+
+        class Sink:
+            encoding = "utf-8"
+            def write(self, text):
+                writes.append(text)
+            def flush(self):
+                pass
+            def isatty(self):
+                return False
+
+        from rich.console import Console
+        with patch("gmab.cli.check_config_exists", return_value=True), \
+             patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
+             patch("gmab.commands.list.get_detailed_instances", return_value=[self.SAMPLE, self.SAMPLE]), \
+             patch("gmab.cli.Console", side_effect=lambda: Console(file=Sink(), width=120)):
+            result = CliRunner().invoke(cli, ["list", "detail"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0].count("Time left"), 2)
+
     def test_detail_all(self):
         result, gdi, rid = self._run(["list", "detail"])
         self.assertEqual(result.exit_code, 0)
@@ -121,8 +187,8 @@ class TestListDetailGrammar(unittest.TestCase):
     def test_plain_list_does_not_use_detail(self):
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.list_boxes", return_value=[]), \
-             patch("gmab.cli.get_detailed_instances") as gdi:
+             patch("gmab.commands.list.list_boxes", return_value=[]), \
+             patch("gmab.commands.list.get_detailed_instances") as gdi:
             CliRunner().invoke(cli, ["list"])
         gdi.assert_not_called()
 
@@ -144,7 +210,7 @@ class TestListJsonOutput(unittest.TestCase):
     def test_list_json_is_valid_array(self):
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.list_boxes", return_value=self.SAMPLE):
+             patch("gmab.commands.list.list_boxes", return_value=self.SAMPLE):
             result = CliRunner().invoke(cli, ["list", "-o", "json"])
         data = json.loads(result.output)
         self.assertEqual(len(data), 1)
@@ -155,7 +221,7 @@ class TestListJsonOutput(unittest.TestCase):
     def test_list_json_empty_is_empty_array(self):
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.list_boxes", return_value=[]):
+             patch("gmab.commands.list.list_boxes", return_value=[]):
             result = CliRunner().invoke(cli, ["list", "-o", "json"])
         self.assertEqual(json.loads(result.output), [])
 
@@ -163,7 +229,7 @@ class TestListJsonOutput(unittest.TestCase):
         details = [(self.SAMPLE[0], {"raw": 1}, [("Flavor", "d2-2")])]
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.get_detailed_instances", return_value=details):
+             patch("gmab.commands.list.get_detailed_instances", return_value=details):
             result = CliRunner().invoke(cli, ["list", "detail", "-o", "json"])
         data = json.loads(result.output)
         self.assertEqual(data[0]["extras"], {"Flavor": "d2-2"})
@@ -173,7 +239,7 @@ class TestListJsonOutput(unittest.TestCase):
         details = [(self.SAMPLE[0], {"raw": 1, "vpc": "v-1"}, [("Flavor", "d2-2")])]
         with patch("gmab.cli.check_config_exists", return_value=True), \
              patch("gmab.cli.get_configured_providers", return_value=["ovh"]), \
-             patch("gmab.cli.get_detailed_instances", return_value=details):
+             patch("gmab.commands.list.get_detailed_instances", return_value=details):
             result = CliRunner().invoke(cli, ["list", "detail", "verbose", "-o", "json"])
         data = json.loads(result.output)
         self.assertEqual(data[0]["details"], {"raw": 1, "vpc": "v-1"})
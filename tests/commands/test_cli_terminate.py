@@ -1,4 +1,5 @@
 import json
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -19,8 +20,8 @@ class TestCliTerminateConfirmation(ConfigDirTestCase):
         self.runner = CliRunner()
 
     def test_single_instance_prompts_and_cancels_on_no(self):
-        with patch("gmab.cli.list_boxes", return_value=[]), \
-             patch("gmab.cli.terminate_box") as tb:
+        with patch("gmab.commands.list.list_boxes", return_value=[]), \
+             patch("gmab.commands.terminate.terminate_box") as tb:
             result = self.runner.invoke(cli, ["terminate", "gmab-foo"], input="n\n")
         self.assertIn("will be terminated", result.output)
         self.assertIn("proceed", result.output.lower())
@@ -28,14 +29,14 @@ class TestCliTerminateConfirmation(ConfigDirTestCase):
         tb.assert_not_called()
 
     def test_single_instance_proceeds_on_yes(self):
-        with patch("gmab.cli.list_boxes", return_value=[]), \
-             patch("gmab.cli.terminate_box") as tb:
+        with patch("gmab.commands.list.list_boxes", return_value=[]), \
+             patch("gmab.commands.terminate.terminate_box") as tb:
             result = self.runner.invoke(cli, ["terminate", "gmab-foo"], input="y\n")
         self.assertIn("will be terminated", result.output)
         tb.assert_called_once()
 
     def test_yes_flag_skips_prompt(self):
-        with patch("gmab.cli.terminate_box") as tb:
+        with patch("gmab.commands.terminate.terminate_box") as tb:
             result = self.runner.invoke(cli, ["terminate", "gmab-foo", "-y"])
         self.assertNotIn("Are you sure", result.output)
         tb.assert_called_once()
@@ -53,18 +54,18 @@ class TestCliTerminateBatchPreview(ConfigDirTestCase):
         ]
 
     def test_terminate_all_renders_table_preview(self):
-        with patch("gmab.cli.list_boxes", return_value=self.sample), \
+        with patch("gmab.commands.list.list_boxes", return_value=self.sample), \
              patch("gmab.cli.render_instances_table") as render, \
-             patch("gmab.cli.terminate_box"):
+             patch("gmab.commands.terminate.terminate_boxes", return_value={}):
             result = self.runner.invoke(cli, ["terminate", "all"], input="n\n")
         self.assertIn("will be terminated", result.output)
         render.assert_called_once_with(self.sample)
 
     def test_terminate_expired_renders_table_preview(self):
         expired = [dict(self.sample[0], is_expired=True, lifetime_left=0)]
-        with patch("gmab.cli.list_boxes", return_value=expired), \
+        with patch("gmab.commands.list.list_boxes", return_value=expired), \
              patch("gmab.cli.render_instances_table") as render, \
-             patch("gmab.cli.terminate_box"):
+             patch("gmab.commands.terminate.terminate_boxes", return_value={}):
             result = self.runner.invoke(cli, ["terminate", "expired"], input="n\n")
         self.assertIn("expired instances will be terminated", result.output)
         render.assert_called_once_with(expired)
@@ -82,9 +83,9 @@ class TestCliTerminateJson(ConfigDirTestCase):
         ]
 
     def test_terminate_all_json_reports_results(self):
-        with patch("gmab.cli.list_boxes", return_value=self.sample), \
+        with patch("gmab.commands.list.list_boxes", return_value=self.sample), \
              patch("gmab.cli.render_instances_table") as render, \
-             patch("gmab.cli.terminate_box"):
+             patch("gmab.commands.terminate.terminate_boxes", return_value={}):
             result = self.runner.invoke(cli, ["terminate", "all", "-y", "-o", "json"])
         data = json.loads(result.output)
         self.assertEqual(data["terminated_count"], 1)
@@ -96,8 +97,8 @@ class TestCliTerminateJson(ConfigDirTestCase):
         # Without -y, the to-be-terminated plan + prompt go to stderr; stdout
         # stays a single JSON result document.
         runner = CliRunner(mix_stderr=False)
-        with patch("gmab.cli.list_boxes", return_value=self.sample), \
-             patch("gmab.cli.terminate_box"):
+        with patch("gmab.commands.list.list_boxes", return_value=self.sample), \
+             patch("gmab.commands.terminate.terminate_boxes", return_value={}):
             result = runner.invoke(cli, ["terminate", "all", "-o", "json"], input="y\n")
         # CliRunner echoes the typed input onto stdout (a real TTY echoes to the
         # terminal, not the stdout pipe); the result is the object from the first brace.
@@ -109,8 +110,8 @@ class TestCliTerminateJson(ConfigDirTestCase):
         self.assertNotIn("proceed", stdout.lower())
 
     def test_terminate_specific_json_reports_failure(self):
-        with patch("gmab.cli.list_boxes", return_value=[]), \
-             patch("gmab.cli.terminate_box", side_effect=Exception("nope")):
+        with patch("gmab.commands.list.list_boxes", return_value=[]), \
+             patch("gmab.commands.terminate.terminate_box", side_effect=Exception("nope")):
             result = self.runner.invoke(cli, ["terminate", "gmab-x", "-y", "-o", "json"])
         data = json.loads(result.output)
         self.assertEqual(data["terminated_count"], 0)
@@ -118,18 +119,82 @@ class TestCliTerminateJson(ConfigDirTestCase):
         self.assertEqual(data["failed"][0]["error"], "nope")
 
     def test_terminate_all_json_stdout_is_pure_json(self):
-        # Real terminate_box (only the provider layer is mocked) must stay quiet in
+        # Real terminate_boxes (only the provider layer is mocked) must stay quiet in
         # JSON mode, so its per-instance echo doesn't corrupt the stdout JSON.
         from unittest.mock import MagicMock
         fake = MagicMock()
+        fake.terminate_instances.return_value = {}
         runner = CliRunner(mix_stderr=False)
-        with patch("gmab.cli.list_boxes", return_value=self.sample), \
+        with patch("gmab.commands.list.list_boxes", return_value=self.sample), \
              patch("gmab.commands.terminate.load_config", return_value={"linode": {"api_key": "t"}}), \
              patch("gmab.commands.terminate.get_provider", return_value=fake):
             result = runner.invoke(cli, ["terminate", "all", "-y", "-o", "json"])
         data = json.loads(result.stdout)  # would raise if "Terminated instance..." leaked
         self.assertEqual(data["terminated_count"], 1)
-        fake.terminate_instance.assert_called_once()
+        fake.terminate_instances.assert_called_once_with(["1"])
+
+    def test_terminate_specific_ids_keeps_argument_order(self):
+        def terminate(ident, provider, quiet=False):
+            if ident == "gmab-b":
+                raise Exception("gone")
+            return "hetzner" if ident == "gmab-c" else "linode"
+        with patch("gmab.commands.terminate.terminate_box", side_effect=terminate) as tb:
+            result = self.runner.invoke(
+                cli, ["terminate", "gmab-a", "gmab-b", "gmab-c", "-y", "-o", "json"])
+        data = json.loads(result.output)
+        self.assertEqual(tb.call_count, 3)
+        self.assertEqual([t["instance_id"] for t in data["terminated"]], ["gmab-a", "gmab-c"])
+        # No -p: the provider is the one each instance was found on.
+        self.assertEqual([t["provider"] for t in data["terminated"]], ["linode", "hetzner"])
+        self.assertEqual(data["failed"], [{"instance_id": "gmab-b", "error": "gone"}])
+
+    def test_text_confirmations_follow_argument_order(self):
+        first_done = threading.Event()
+
+        def terminate(ident, provider, quiet=False):
+            self.assertTrue(quiet)
+            if ident == "gmab-a":
+                first_done.wait(5)  # finishes after gmab-b
+            else:
+                first_done.set()
+            return "linode"
+
+        with patch("gmab.commands.terminate.terminate_box", side_effect=terminate):
+            result = self.runner.invoke(cli, ["terminate", "gmab-a", "gmab-b", "-y"])
+        lines = [l for l in result.output.splitlines() if l.startswith("Terminated")]
+        self.assertEqual(lines, ["Terminated instance 'gmab-a' on 'linode'.",
+                                 "Terminated instance 'gmab-b' on 'linode'."])
+
+    def test_terminate_all_batches_per_provider_and_reports_failures(self):
+        instances = [
+            dict(self.sample[0], provider="linode", instance_id="1"),
+            dict(self.sample[0], provider="aws", instance_id="i-1"),
+            dict(self.sample[0], provider="linode", instance_id="2"),
+        ]
+
+        def bulk(ids, provider_name, quiet=False):
+            return {"2": "boom"} if provider_name == "linode" else {}
+
+        with patch("gmab.commands.list.list_boxes", return_value=instances), \
+             patch("gmab.commands.terminate.terminate_boxes", side_effect=bulk) as tb:
+            result = self.runner.invoke(cli, ["terminate", "all", "-y", "-o", "json"])
+        data = json.loads(result.output)
+        self.assertEqual([c.args[:2] for c in tb.call_args_list],
+                         [(["1", "2"], "linode"), (["i-1"], "aws")])
+        self.assertEqual({t["instance_id"] for t in data["terminated"]}, {"1", "i-1"})
+        self.assertEqual(data["failed"], [{"instance_id": "2", "error": "boom"}])
+
+    def test_terminate_all_reports_a_failed_bulk_call_per_instance(self):
+        instances = [dict(self.sample[0], provider="aws", instance_id=i) for i in ("i-1", "i-2")]
+        with patch("gmab.commands.list.list_boxes", return_value=instances), \
+             patch("gmab.commands.terminate.terminate_boxes", side_effect=Exception("throttled")):
+            result = self.runner.invoke(cli, ["terminate", "all", "-y", "-o", "json"])
+        data = json.loads(result.output)
+        self.assertEqual(data["terminated"], [])
+        self.assertEqual(data["failed"], [
+            {"instance_id": i, "error": "Failed to terminate instance: throttled"}
+            for i in ("i-1", "i-2")
+        ])
 
 
 if __name__ == "__main__":
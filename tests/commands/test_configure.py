@@ -4,7 +4,9 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
-from gmab.commands.configure import run_configure, validate_configs, print_configs
+from gmab.commands.configure import (
+    run_configure, validate_configs, print_configs, mask_provider_secrets, update_nested_dict,
+)
 from gmab.utils.paths import get_config_file_path
 from tests.support.config_env import ConfigDirTestCase
 
@@ -68,5 +70,27 @@ class TestPrintConfigs(ConfigDirTestCase):
         self.assertIn("nl-ams", output)
 
 
+class TestMaskProviderSecrets(unittest.TestCase):
+    def test_masks_declared_secrets_without_mutating_input(self):
+        config = {"aws": {"access_key": "AK", "default_region": "eu-west-1"}}
+        masked = mask_provider_secrets(config)
+        self.assertEqual(masked["aws"], {"access_key": "********", "default_region": "eu-west-1"})
+        self.assertEqual(config["aws"]["access_key"], "AK")
+
+
+class TestUpdateNestedDict(unittest.TestCase):
+    def test_merges_nested_and_skips_none(self):
+        original = {"linode": {"api_key": "a", "default_region": "nl-ams"}, "keep": 1}
+        result = update_nested_dict(
+            original, {"linode": {"api_key": "b", "default_region": None}, "aws": {"x": 1}}
+        )
+        self.assertIs(result, original)
+        self.assertEqual(original, {
+            "linode": {"api_key": "b", "default_region": "nl-ams"},
+            "keep": 1,
+            "aws": {"x": 1},
+        })
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,10 @@
+import threading
 import time
 import unittest
 from unittest.mock import patch
 
 from gmab.commands.list import list_boxes, get_lifetime_left
+from gmab.utils.instance_index import lookup_instance
 from tests.support.config_env import ConfigDirTestCase
 from tests.support.fakes import FakeProvider, make_instance
 
@@ -19,6 +21,10 @@ class TestGetLifetimeLeft(unittest.TestCase):
         inst = {"creation_time": int(time.time()) - 200 * 60, "lifetime_minutes": 60}
         self.assertEqual(get_lifetime_left(inst), 0)
 
+    def test_uses_given_now(self):
+        inst = {"creation_time": 1000, "lifetime_minutes": 60}
+        self.assertEqual(get_lifetime_left(inst, now=1000 + 15 * 60), 45)
+
 
 def fake_for(name, instances):
     f = FakeProvider({})
@@ -43,6 +49,13 @@ class TestListBoxes(ConfigDirTestCase):
         self.assertEqual(instances[0]["label"], "het")
         self.assertIn("lifetime_left", instances[0])
 
+    def test_listing_all_providers_writes_instance_index(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
+        fake = fake_for("linode", [make_instance(provider="linode", instance_id="5", label="gmab-idx")])
+        with patch("gmab.commands.list.get_provider", return_value=fake):
+            list_boxes()
+        self.assertEqual(lookup_instance("gmab-idx"), ("linode", "5"))
+
     def test_skips_empty_provider_config(self):
         self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}, "aws": {}})
         fakes = {"linode": fake_for("linode", [make_instance(provider="linode")])}
@@ -70,6 +83,28 @@ class TestListBoxes(ConfigDirTestCase):
         self.assertEqual([i["label"] for i in instances], ["ok"])
         self.assertTrue(any("Failed to list instances" in str(c) for c in echo.call_args_list))
 
+    def test_providers_are_queried_concurrently(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}, "hetzner": {"api_key": "b"}})
+        # Each fake blocks until both are in flight; sequential listing would
+        # time out the barrier and drop a provider.
+        barrier = threading.Barrier(2, timeout=5)
+        fakes = {}
+        for name in ("linode", "hetzner"):
+            fake = fake_for(name, [make_instance(provider=name, label=name)])
+            original = fake.list_instances
+            fake.list_instances = lambda original=original: (barrier.wait(), original())[1]
+            fakes[name] = fake
+        with patch("gmab.commands.list.get_provider", side_effect=lambda name, cfg: fakes[name]):
+            instances = list_boxes()
+        self.assertEqual({i["label"] for i in instances}, {"linode", "hetzner"})
+
+    def test_compute_lifetime_false_skips_decoration(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
+        fake = fake_for("linode", [make_instance(provider="linode")])
+        with patch("gmab.commands.list.get_provider", return_value=fake):
+            instances = list_boxes("linode", compute_lifetime=False)
+        self.assertNotIn("lifetime_left", instances[0])
+
     def test_specific_unconfigured_provider_raises(self):
         self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
         with self.assertRaises(Exception):
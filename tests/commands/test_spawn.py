@@ -64,6 +64,35 @@ class TestSpawnBox(ConfigDirTestCase):
         self.assertEqual(payload["instance_id"], "1")
         self.assertIn("ssh_user", payload)
 
+    def test_count_spawns_several_and_reports_failures(self):
+        self.fake.spawn_instances = MagicMock(return_value=(
+            [make_instance(instance_id="1"), make_instance(instance_id="2")], ["quota exceeded"]
+        ))
+        with patch("gmab.commands.spawn.get_provider", return_value=self.fake), \
+             patch("gmab.commands.spawn.click.echo") as echo:
+            result = spawn_box(count=3)
+        self.assertEqual(self.fake.spawn_instances.call_args[0][0], 3)
+        self.assertEqual([i["instance_id"] for i in result], ["1", "2"])
+        output = "\n".join(str(c) for c in echo.call_args_list)
+        self.assertIn("Failed to spawn 1 of 3 instances", output)
+        self.assertIn("quota exceeded", output)
+
+    def test_count_json_output(self):
+        import json
+        with patch("gmab.commands.spawn.get_provider", return_value=self.fake), \
+             patch("gmab.utils.output.click.echo") as echo:
+            spawn_box(output="json", count=2)
+        payload = json.loads(echo.call_args[0][0])
+        self.assertEqual(payload["spawned_count"], 2)
+        self.assertEqual(payload["failed"], [])
+        self.assertEqual(len(self.fake.spawn_calls), 2)
+
+    def test_count_raises_when_every_spawn_fails(self):
+        self.fake.spawn_instances = MagicMock(return_value=([], ["boom", "boom"]))
+        with patch("gmab.commands.spawn.get_provider", return_value=self.fake):
+            with self.assertRaisesRegex(Exception, "boom"):
+                spawn_box(count=2)
+
     def test_unconfigured_provider_raises(self):
         with patch("gmab.commands.spawn.get_provider", return_value=self.fake):
             with self.assertRaises(Exception):
@@ -1,7 +1,9 @@
+import threading
 import unittest
 from unittest.mock import patch
 
-from gmab.commands.terminate import get_instance_provider, terminate_box
+from gmab.commands.terminate import get_instance_provider, locate_instance, terminate_box, terminate_boxes
+from gmab.utils.instance_index import save_instance_index, lookup_instance
 from tests.support.config_env import ConfigDirTestCase
 from tests.support.fakes import FakeProvider, make_instance
 
@@ -16,7 +18,7 @@ def fake_for(name, instances=None):
     return f
 
 
-class TestGetInstanceProvider(unittest.TestCase):
+class TestGetInstanceProvider(ConfigDirTestCase):
     def test_aws_fastpath_skips_scanning(self):
         # If the fast path works, we never call list_instances (which here raises).
         scanning = fake_for("aws")
@@ -36,6 +38,52 @@ class TestGetInstanceProvider(unittest.TestCase):
             name, provider = get_instance_provider("gmab-foo", {"linode": {"api_key": "a"}, "hetzner": {"api_key": "b"}})
         self.assertEqual(name, "linode")
 
+    def test_providers_are_scanned_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        fakes = {
+            "linode": fake_for("linode", []),
+            "hetzner": fake_for("hetzner", [make_instance(provider="hetzner", label="gmab-foo")]),
+        }
+        for fake in fakes.values():
+            original = fake.list_instances
+            fake.list_instances = lambda original=original: (barrier.wait(), original())[1]
+        with patch("gmab.commands.terminate.get_provider", side_effect=lambda n, c: fakes[n]):
+            name, provider = get_instance_provider("gmab-foo", {"linode": {"api_key": "a"}, "hetzner": {"api_key": "b"}})
+        self.assertEqual(name, "hetzner")
+        self.assertIs(provider, fakes["hetzner"])
+
+    def test_shared_numeric_id_resolves_in_config_order(self):
+        hetzner_answered = threading.Event()
+        fakes = {
+            "linode": fake_for("linode", [make_instance(provider="linode", instance_id="42")]),
+            "hetzner": fake_for("hetzner", [make_instance(provider="hetzner", instance_id="42")]),
+        }
+        slow_listing = fakes["linode"].list_instances
+        fakes["linode"].list_instances = lambda: (hetzner_answered.wait(5), slow_listing())[1]
+        fast_listing = fakes["hetzner"].list_instances
+        fakes["hetzner"].list_instances = lambda: (fast_listing(), hetzner_answered.set())[0]
+        with patch("gmab.commands.terminate.get_provider", side_effect=lambda n, c: fakes[n]):
+            name, provider = get_instance_provider("42", {"linode": {"api_key": "a"}, "hetzner": {"api_key": "b"}})
+        self.assertEqual(name, "linode")
+
+    def test_locate_returns_matching_record(self):
+        record = make_instance(provider="linode", label="gmab-foo", instance_id="77")
+        fake = fake_for("linode", [record])
+        with patch("gmab.commands.terminate.get_provider", return_value=fake):
+            name, provider, instance = locate_instance("gmab-foo", {"linode": {"api_key": "a"}})
+        self.assertEqual((name, provider, instance), ("linode", fake, record))
+
+    def test_indexed_instance_skips_listing(self):
+        save_instance_index([make_instance(provider="hetzner", instance_id="9", label="gmab-foo")])
+        scanning = fake_for("hetzner")
+        def boom():
+            raise AssertionError("should not scan")
+        scanning.list_instances = boom
+        with patch("gmab.commands.terminate.get_provider", return_value=scanning):
+            name, provider, instance = locate_instance("gmab-foo", {"hetzner": {"api_key": "b"}})
+        self.assertEqual(name, "hetzner")
+        self.assertEqual(instance["instance_id"], "9")
+
     def test_not_found_returns_none(self):
         fakes = {"linode": fake_for("linode", [make_instance(provider="linode", label="gmab-other")])}
         with patch("gmab.commands.terminate.get_provider", side_effect=lambda n, c: fakes[n]):
@@ -63,7 +111,16 @@ class TestTerminateBox(ConfigDirTestCase):
         fake = fake_for("linode", [make_instance(provider="linode", label="gmab-foo", instance_id="50")])
         with patch("gmab.commands.terminate.get_provider", return_value=fake):
             terminate_box("gmab-foo")
-        self.assertEqual(fake.terminated, ["gmab-foo"])
+        # The label was resolved while locating the provider, so the native ID
+        # is what gets terminated (no second listing to resolve the label).
+        self.assertEqual(fake.terminated, ["50"])
+
+    def test_terminate_invalidates_index(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
+        save_instance_index([make_instance(provider="linode", instance_id="123", label="gmab-x")])
+        with patch("gmab.commands.terminate.get_provider", return_value=fake_for("linode")):
+            terminate_box("123", "linode", quiet=True)
+        self.assertIsNone(lookup_instance("gmab-x"))
 
     def test_unconfigured_explicit_provider_raises(self):
         self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
@@ -71,5 +128,20 @@ class TestTerminateBox(ConfigDirTestCase):
             terminate_box("i-1", "aws")
 
 
+class TestTerminateBoxes(ConfigDirTestCase):
+    def test_bulk_terminates_on_one_provider(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
+        fake = fake_for("linode")
+        with patch("gmab.commands.terminate.get_provider", return_value=fake):
+            errors = terminate_boxes(["1", "2"], "linode", quiet=True)
+        self.assertEqual(errors, {})
+        self.assertEqual(fake.terminated, ["1", "2"])
+
+    def test_unconfigured_provider_raises(self):
+        self.write_configs(general=GENERAL, providers={"linode": {"api_key": "a"}})
+        with self.assertRaises(ValueError):
+            terminate_boxes(["i-1"], "aws")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch
 from botocore.stub import Stubber
 
 from gmab.providers.aws import AWSProvider
+from gmab.utils.api_cache import cache_get, cache_put
+from tests.support.config_env import ConfigDirTestCase
 from tests.support.contracts import assert_instance_shape
 
 
@@ -51,7 +53,29 @@ class TestAWSSshUser(unittest.TestCase):
         self.assertEqual(make_provider().ssh_user(), "ubuntu")
 
 
-class TestAWSList(unittest.TestCase):
+class TestAWSClients(unittest.TestCase):
+    def test_clients_are_shared_per_credentials_and_region(self):
+        a, b = make_provider(), make_provider()
+        self.assertIs(a.ec2, b.ec2)
+        self.assertIs(a.ec2_resource, b.ec2_resource)
+        other = AWSProvider({"access_key": "AKIAFAKE", "secret_key": "secretfake",
+                             "default_region": "us-east-1"})
+        self.assertIsNot(other.ec2, a.ec2)
+        self.assertEqual(other.ec2.meta.region_name, "us-east-1")
+
+    def test_clients_are_built_on_first_use(self):
+        provider = make_provider()
+        self.assertNotIn("ec2", vars(provider))
+        provider.ec2
+        self.assertIn("ec2", vars(provider))
+
+    def test_clients_use_adaptive_retries(self):
+        retries = make_provider().ec2.meta.config.retries
+        self.assertEqual(retries["mode"], "adaptive")
+        self.assertEqual(retries["total_max_attempts"], 11)  # 10 retries + the first try
+
+
+class TestAWSList(ConfigDirTestCase):
     def test_list_parses_and_computes_expiry(self):
         now = int(time.time())
         old = now - 2 * 60 * 60
@@ -76,9 +100,47 @@ class TestAWSList(unittest.TestCase):
         for inst in instances:
             assert_instance_shape(self, inst)
 
+    def test_list_follows_pagination(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [_instance("i-1", "gmab-a", "1.1.1.1", now, 60)]}],
+             "NextToken": "page2"},
+        )
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [_instance("i-2", "gmab-b", "2.2.2.2", now, 60)]}]},
+        )
+        with stub:
+            instances = provider.list_instances()
+        stub.assert_no_pending_responses()
+        self.assertEqual([i["instance_id"] for i in instances], ["i-1", "i-2"])
+
+    def test_list_is_live_and_recorded_for_lookups(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        listing = {"Reservations": [{"Instances": [
+            _instance("i-1", "gmab-live", "1.1.1.1", now, 60)
+        ]}]}
+        stub.add_response("describe_instances", listing)
+        stub.add_response("describe_instances", listing)
+        stub.add_response("terminate_instances", {})
+        stub.add_response("describe_instances", {"Reservations": []})
+        with stub:
+            provider.list_instances()
+            first = provider.list_instances()
+            # A second provider object (i.e. the next command) looks up from the cache.
+            self.assertEqual(make_provider().lookup_instances(), first)
+            provider.terminate_instance("i-1")
+            self.assertEqual(provider.lookup_instances(), [])
+        stub.assert_no_pending_responses()
 
-class TestAWSTerminate(unittest.TestCase):
-    def test_terminate_deletes_keypair_then_instance(self):
+
+class TestAWSTerminate(ConfigDirTestCase):
+    def test_terminate_deletes_legacy_keypair_then_instance(self):
         now = int(time.time())
         provider = make_provider()
         stub = Stubber(provider.ec2)
@@ -94,6 +156,96 @@ class TestAWSTerminate(unittest.TestCase):
             provider.terminate_instance("i-1")
         stub.assert_no_pending_responses()
 
+    def test_terminate_keeps_the_shared_key_pair(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [
+                _instance("i-1", "gmab-live", "1.1.1.1", now, 60, key_name="gmab-pubkey-0123456789abcdef")
+            ]}]},
+        )
+        stub.add_response("terminate_instances", {})  # no delete_key_pair expected
+        with stub:
+            provider.terminate_instance("i-1")
+        stub.assert_no_pending_responses()
+
+    def test_terminate_by_label_describes_once(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [
+                _instance("i-7", "gmab-target", "1.1.1.1", now, 60, key_name="gmab-key-abc")
+            ]}]},
+        )
+        stub.add_response("delete_key_pair", {}, {"KeyName": "gmab-key-abc"})
+        stub.add_response("terminate_instances", {}, {"InstanceIds": ["i-7"]})
+        with stub:
+            provider.terminate_instance("gmab-target")
+        stub.assert_no_pending_responses()
+
+    def test_terminate_after_list_skips_describe(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [
+                _instance("i-1", "gmab-a", "1.1.1.1", now, 60, key_name="gmab-key-abc"),
+                _instance("i-2", "gmab-b", "2.2.2.2", now, 60),
+            ]}]},
+        )
+        stub.add_response("delete_key_pair", {}, {"KeyName": "gmab-key-abc"})
+        stub.add_response("terminate_instances", {}, {"InstanceIds": ["i-1", "i-2"]})
+        with stub:
+            provider.list_instances()
+            errors = provider.terminate_instances(["i-1", "i-2"])
+        stub.assert_no_pending_responses()
+        self.assertEqual(errors, {})
+
+    def test_bulk_terminate_uses_one_api_call(self):
+        now = int(time.time())
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_response(
+            "describe_instances",
+            {"Reservations": [{"Instances": [
+                _instance("i-1", "gmab-a", "1.1.1.1", now, 60, key_name="gmab-key-abc"),
+                _instance("i-2", "gmab-b", "2.2.2.2", now, 60, key_name="gmab-key-abc"),
+            ]}]},
+            {"InstanceIds": ["i-1", "i-2"]},
+        )
+        stub.add_response("delete_key_pair", {}, {"KeyName": "gmab-key-abc"})
+        stub.add_response("terminate_instances", {}, {"InstanceIds": ["i-1", "i-2"]})
+        with stub:
+            errors = provider.terminate_instances(["i-1", "i-2"])
+        stub.assert_no_pending_responses()
+        self.assertEqual(errors, {})
+
+    @patch("gmab.providers.aws.TERMINATE_BATCH_SIZE", 2)
+    def test_bulk_terminate_splits_into_api_sized_batches(self):
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        for batch in (["i-1", "i-2"], ["i-3"]):
+            stub.add_response("describe_instances", {"Reservations": []}, {"InstanceIds": batch})
+            stub.add_response("terminate_instances", {}, {"InstanceIds": batch})
+        with stub:
+            errors = provider.terminate_instances(["i-1", "i-2", "i-3"])
+        stub.assert_no_pending_responses()
+        self.assertEqual(errors, {})
+
+    def test_label_lookup_errors_are_not_reported_as_missing(self):
+        provider = make_provider()
+        stub = Stubber(provider.ec2)
+        stub.add_client_error("describe_instances", "AuthFailure", "bad creds")
+        with stub:
+            errors = provider.terminate_instances(["gmab-target"])
+        self.assertIn("AuthFailure", errors["gmab-target"])
+        self.assertNotIn("No instance found", errors["gmab-target"])
+
     def test_find_instance_id_by_label(self):
         now = int(time.time())
         provider = make_provider()
@@ -108,7 +260,7 @@ class TestAWSTerminate(unittest.TestCase):
             self.assertEqual(provider.find_instance_id_by_label("gmab-target"), "i-7")
 
 
-class TestAWSSpawn(unittest.TestCase):
+class TestAWSSpawn(ConfigDirTestCase):
     @patch.object(AWSProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
     def test_spawn_tags_and_returns_contract(self, _ssh):
         provider = make_provider()
@@ -141,6 +293,117 @@ class TestAWSSpawn(unittest.TestCase):
         self.assertEqual(result["instance_id"], "i-99")
         self.assertEqual(result["ip"], "9.9.9.9")
         self.assertEqual(result["lifetime_minutes"], 15)
+        provider.ec2.get_waiter.return_value.wait.assert_called_once_with(
+            InstanceIds=["i-99"], WaiterConfig={"Delay": 3, "MaxAttempts": 200}
+        )
+
+    @patch.object(AWSProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    def test_listing_cached_during_the_wait_is_dropped(self, _ssh):
+        provider = make_provider()
+        provider._network = lambda: ("vpc-1", "sg-1", "subnet-1")
+        provider.ec2 = MagicMock()
+        provider.ec2.run_instances.return_value = {"Instances": [{"InstanceId": "i-99"}]}
+        provider.ec2.describe_instances.return_value = {
+            "Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]
+        }
+        key = provider._cache_key("instances")
+        # e.g. a concurrent `gmab terminate <label>` looking up while i-99 is pending.
+        provider.ec2.get_waiter.return_value.wait.side_effect = (
+            lambda **kw: cache_put("aws", key, [{"instance_id": "i-99", "status": "pending"}])
+        )
+
+        provider.spawn_instance()
+
+        self.assertIsNone(cache_get("aws", key, 60))
+
+    def test_key_pair_is_reused_for_the_same_public_key(self):
+        from botocore.exceptions import ClientError
+
+        provider = make_provider()
+        provider.ec2 = MagicMock()
+        first = provider._get_or_import_key("ssh-ed25519 AAAA")
+        self.assertRegex(first, r"^gmab-pubkey-[0-9a-f]{16}$")
+        self.assertEqual(provider._get_or_import_key("ssh-ed25519 AAAA"), first)
+        self.assertEqual(provider.ec2.import_key_pair.call_count, 1)
+
+        # A fresh process finds the pair already imported in AWS and reuses it.
+        other = make_provider()
+        other.ec2 = MagicMock()
+        other.ec2.import_key_pair.side_effect = ClientError(
+            {"Error": {"Code": "InvalidKeyPair.Duplicate", "Message": "exists"}}, "ImportKeyPair"
+        )
+        self.assertEqual(other._get_or_import_key("ssh-ed25519 AAAA"), first)
+        self.assertNotEqual(other._get_or_import_key("ssh-ed25519 BBBB"), first)
+
+    @patch.object(AWSProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    def test_stale_cached_network_is_rebuilt_and_retried(self, _ssh):
+        from botocore.exceptions import ClientError
+
+        subnets = iter(["subnet-gone", "subnet-new"])
+        provider = make_provider()
+        provider.get_or_create_vpc = lambda: "vpc-1"
+        provider.get_or_create_security_group = lambda vpc_id: "sg-1"
+        provider.get_subnet_id = lambda vpc_id: next(subnets)
+        provider.ec2 = MagicMock()
+        provider.ec2.run_instances.side_effect = [
+            {"Instances": [{"InstanceId": "i-1"}]},
+            ClientError({"Error": {"Code": "InvalidSubnetID.NotFound", "Message": "gone"}},
+                        "RunInstances"),
+            {"Instances": [{"InstanceId": "i-2"}]},
+        ]
+        provider.ec2.describe_instances.return_value = {
+            "Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]
+        }
+        provider.spawn_instance()
+        self.assertEqual(provider.spawn_instance()["instance_id"], "i-2")
+        used = [c.kwargs["SubnetId"] for c in provider.ec2.run_instances.call_args_list]
+        self.assertEqual(used, ["subnet-gone", "subnet-gone", "subnet-new"])
+
+    @patch.object(AWSProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    def test_network_ids_are_cached_across_spawns(self, _ssh):
+        lookups = []
+        for _ in range(2):
+            provider = make_provider()
+            provider.get_or_create_vpc = lambda: lookups.append("vpc") or "vpc-1"
+            provider.get_or_create_security_group = lambda vpc_id: lookups.append("sg") or "sg-1"
+            provider.get_subnet_id = lambda vpc_id: lookups.append("subnet") or "subnet-1"
+            provider.ec2 = MagicMock()
+            provider.ec2.run_instances.return_value = {"Instances": [{"InstanceId": "i-99"}]}
+            provider.ec2.describe_instances.return_value = {
+                "Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]
+            }
+            provider.spawn_instance()
+            kwargs = provider.ec2.run_instances.call_args.kwargs
+            self.assertEqual(kwargs["SecurityGroupIds"], ["sg-1"])
+            self.assertEqual(kwargs["SubnetId"], "subnet-1")
+        self.assertCountEqual(lookups, ["vpc", "sg", "subnet"])
+
+    @patch.object(AWSProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    def test_spawn_many_resolves_network_and_key_once(self, _ssh):
+        from botocore.exceptions import ClientError
+
+        lookups = []
+        provider = make_provider()
+        provider.get_or_create_vpc = lambda: lookups.append("vpc") or "vpc-1"
+        provider.get_or_create_security_group = lambda vpc_id: "sg-1"
+        provider.get_subnet_id = lambda vpc_id: "subnet-1"
+        provider.ec2 = MagicMock()
+        provider.ec2.run_instances.side_effect = [
+            {"Instances": [{"InstanceId": "i-1"}]},
+            ClientError({"Error": {"Code": "InsufficientInstanceCapacity", "Message": "no"}},
+                        "RunInstances"),
+            {"Instances": [{"InstanceId": "i-3"}]},
+        ]
+        provider.ec2.describe_instances.return_value = {
+            "Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]
+        }
+
+        instances, errors = provider.spawn_instances(3)
+
+        self.assertEqual((len(instances), len(errors)), (2, 1))
+        self.assertEqual(lookups, ["vpc"])
+        provider.ec2.import_key_pair.assert_called_once()
+        provider.ec2.delete_key_pair.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -24,6 +24,10 @@ class TestIsExpired(unittest.TestCase):
         two_hours_ago = int(time.time()) - 2 * 60 * 60
         self.assertTrue(FakeProvider.is_expired(str(two_hours_ago), "60"))
 
+    def test_uses_given_now(self):
+        self.assertFalse(FakeProvider.is_expired(1000, 1, now=1060))
+        self.assertTrue(FakeProvider.is_expired(1000, 1, now=1061))
+
 
 class TestReadSshKey(unittest.TestCase):
     def setUp(self):
@@ -38,6 +42,15 @@ class TestReadSshKey(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_repeat_reads_come_from_cache(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as f:
+            f.write("ssh-ed25519 BBBB\n")
+        self.assertEqual(self.provider._read_ssh_key(path), "ssh-ed25519 BBBB")
+        os.remove(path)
+        # Served from the per-process cache without touching the filesystem.
+        self.assertEqual(self.provider._read_ssh_key(path), "ssh-ed25519 BBBB")
+
     def test_missing_key_raises(self):
         with self.assertRaises(FileNotFoundError):
             self.provider._read_ssh_key("/nonexistent/path/to/key.pub")
@@ -58,6 +71,42 @@ class TestFindInstanceIdByLabel(unittest.TestCase):
         self.assertIsNone(self.provider.find_instance_id_by_label("gmab-zzz"))
 
 
+class TestTerminateInstances(unittest.TestCase):
+    def test_default_terminates_each_and_collects_errors(self):
+        provider = FakeProvider({})
+        original = provider.terminate_instance
+
+        def terminate(instance_id):
+            if instance_id == "bad":
+                raise Exception("nope")
+            original(instance_id)
+        provider.terminate_instance = terminate
+
+        errors = provider.terminate_instances(["1", "bad", "2"])
+        self.assertEqual(provider.terminated, ["1", "2"])
+        self.assertEqual(errors, {"bad": "nope"})
+
+
+class TestSpawnInstances(unittest.TestCase):
+    def test_spawns_count_and_collects_errors(self):
+        provider = FakeProvider({})
+        results = iter([make_instance(instance_id="1"), Exception("quota"), make_instance(instance_id="3")])
+
+        def spawn(**kwargs):
+            provider.spawn_calls.append(kwargs)
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        provider.spawn_instance = spawn
+
+        instances, errors = provider.spawn_instances(3, image="img", lifetime_minutes=5)
+        self.assertEqual(len(provider.spawn_calls), 3)
+        self.assertTrue(all(c == {"image": "img", "lifetime_minutes": 5} for c in provider.spawn_calls))
+        self.assertEqual(len(instances), 2)
+        self.assertEqual(errors, ["quota"])
+
+
 class TestMakeLabel(unittest.TestCase):
     def test_default_format(self):
         label = make_label()
@@ -71,6 +120,10 @@ class TestMakeLabel(unittest.TestCase):
         s = generate_random_string(20)
         self.assertTrue(re.fullmatch(r"[a-z0-9]{20}", s), s)
 
+    def test_generate_random_string_exact_length(self):
+        for length in (1, 7, 8, 12, 33):
+            self.assertEqual(len(generate_random_string(length)), length)
+
 
 class TestSshUser(unittest.TestCase):
     def test_default_is_root(self):
@@ -3,8 +3,9 @@ import unittest
 from unittest.mock import patch
 
 from gmab.providers.hetzner import HetznerProvider
+from tests.support.config_env import ConfigDirTestCase
 from tests.support.contracts import assert_instance_shape
-from tests.support.http import mock_response
+from tests.support.http import mock_response, sent_json
 
 
 def make_provider():
@@ -24,10 +25,10 @@ class TestHetznerInit(unittest.TestCase):
             HetznerProvider({})
 
 
-class TestHetznerSpawn(unittest.TestCase):
+class TestHetznerSpawn(ConfigDirTestCase):
     @patch.object(HetznerProvider, "_get_or_create_ssh_key", return_value=42)
     @patch.object(HetznerProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
-    @patch("gmab.providers.hetzner.requests.post")
+    @patch("gmab.providers.hetzner._SESSION.post")
     def test_spawn_builds_payload_and_returns_contract(self, mock_post, _ssh, _key):
         mock_post.return_value = mock_response(
             {"server": {"id": 555, "status": "running",
@@ -40,7 +41,7 @@ class TestHetznerSpawn(unittest.TestCase):
 
         args, kwargs = mock_post.call_args
         self.assertEqual(args[0], "https://api.hetzner.cloud/v1/servers")
-        payload = kwargs["json"]
+        payload = sent_json(mock_post.call_args)
         self.assertEqual(payload["server_type"], "cpx22")
         self.assertEqual(payload["location"], "nbg1")
         self.assertEqual(payload["ssh_keys"], [42])
@@ -54,10 +55,39 @@ class TestHetznerSpawn(unittest.TestCase):
         self.assertEqual(result["ip"], "5.5.5.5")
         self.assertEqual(result["lifetime_minutes"], 45)
 
+    @patch.object(HetznerProvider, "_get_or_create_ssh_key", return_value=42)
+    @patch.object(HetznerProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    @patch("gmab.providers.hetzner._SESSION.post")
+    def test_spawn_overrides_leave_the_body_template_alone(self, mock_post, _ssh, _key):
+        mock_post.return_value = mock_response({"server": {"id": 1, "status": "running"}}, status=201)
+        provider = make_provider()
+
+        provider.spawn_instance(image="debian-12", region="fsn1")
+        provider.spawn_instance()
+
+        first, second = (sent_json(c) for c in mock_post.call_args_list)
+        self.assertEqual((first["image"], first["location"]), ("debian-12", "fsn1"))
+        self.assertEqual((second["image"], second["location"]), ("ubuntu-22.04", "nbg1"))
+        self.assertEqual(provider._server_body_template["labels"], {"gmab": "true"})
+
+    @patch.object(HetznerProvider, "_get_or_create_ssh_key", return_value=42)
+    @patch.object(HetznerProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    @patch("gmab.providers.hetzner._SESSION.post")
+    def test_spawn_many_resolves_the_key_once_first(self, mock_post, _ssh, get_key):
+        order = []
+        get_key.side_effect = lambda content: order.append("key") or 42
+        mock_post.side_effect = lambda *a, **kw: order.append("post") or mock_response(
+            {"server": {"id": 1, "status": "running"}}, status=201
+        )
+        instances, errors = make_provider().spawn_instances(3)
+        self.assertEqual((len(instances), errors), (3, []))
+        self.assertEqual(order[0], "key")
+        self.assertEqual(order.count("post"), 3)
+
 
-class TestHetznerSshKey(unittest.TestCase):
-    @patch("gmab.providers.hetzner.requests.post")
-    @patch("gmab.providers.hetzner.requests.get")
+class TestHetznerSshKey(ConfigDirTestCase):
+    @patch("gmab.providers.hetzner._SESSION.post")
+    @patch("gmab.providers.hetzner._SESSION.get")
     def test_reuses_existing_key(self, mock_get, mock_post):
         mock_get.return_value = mock_response(
             {"ssh_keys": [{"id": 7, "public_key": "ssh-ed25519 AAAA"}]}, status=200
@@ -67,8 +97,8 @@ class TestHetznerSshKey(unittest.TestCase):
         self.assertEqual(key_id, 7)
         mock_post.assert_not_called()
 
-    @patch("gmab.providers.hetzner.requests.post")
-    @patch("gmab.providers.hetzner.requests.get")
+    @patch("gmab.providers.hetzner._SESSION.post")
+    @patch("gmab.providers.hetzner._SESSION.get")
     def test_creates_key_when_missing(self, mock_get, mock_post):
         mock_get.return_value = mock_response({"ssh_keys": []}, status=200)
         mock_post.return_value = mock_response({"ssh_key": {"id": 9}}, status=201)
@@ -77,6 +107,29 @@ class TestHetznerSshKey(unittest.TestCase):
         self.assertEqual(key_id, 9)
         mock_post.assert_called_once()
 
+    @patch("gmab.providers.hetzner._SESSION.get")
+    def test_key_id_is_cached_across_spawns(self, mock_get):
+        mock_get.return_value = mock_response(
+            {"ssh_keys": [{"id": 7, "public_key": "ssh-ed25519 AAAA"}]}, status=200
+        )
+        self.assertEqual(make_provider()._get_or_create_ssh_key("ssh-ed25519 AAAA"), 7)
+        self.assertEqual(make_provider()._get_or_create_ssh_key("ssh-ed25519 AAAA\n"), 7)
+        mock_get.assert_called_once()
+
+    @patch.object(HetznerProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    @patch("gmab.providers.hetzner._SESSION.post")
+    @patch("gmab.providers.hetzner._SESSION.get")
+    def test_failed_create_drops_cached_key(self, mock_get, mock_post, _ssh):
+        mock_get.return_value = mock_response(
+            {"ssh_keys": [{"id": 7, "public_key": "ssh-ed25519 AAAA"}]}, status=200
+        )
+        mock_post.return_value = mock_response(status=422, text="invalid ssh key")
+        provider = make_provider()
+        with self.assertRaises(Exception):
+            provider.spawn_instance()
+        provider._get_or_create_ssh_key("ssh-ed25519 AAAA")
+        self.assertEqual(mock_get.call_count, 2)
+
 
 class TestHetznerList(unittest.TestCase):
     def _api_payload(self):
@@ -95,7 +148,7 @@ class TestHetznerList(unittest.TestCase):
         return {"servers": [server(1, "gmab-live", "1.1.1.1", now, 60),
                             server(2, "gmab-old", "2.2.2.2", old, 60)]}
 
-    @patch("gmab.providers.hetzner.requests.get")
+    @patch("gmab.providers.hetzner._SESSION.get")
     def test_list_parses_and_computes_expiry(self, mock_get):
         mock_get.return_value = mock_response(self._api_payload(), status=200)
         provider = make_provider()
@@ -110,9 +163,50 @@ class TestHetznerList(unittest.TestCase):
         for inst in instances:
             assert_instance_shape(self, inst)
 
+    @patch("gmab.providers.hetzner._SESSION.get")
+    def test_list_fetches_every_page(self, mock_get):
+        servers = self._api_payload()["servers"]
+        def page(url, params, **kw):
+            body = {"servers": [servers[params["page"] - 1]],
+                    "meta": {"pagination": {"page": params["page"], "last_page": 2}}}
+            return mock_response(body, status=200)
+        mock_get.side_effect = page
+
+        instances = make_provider().list_instances()
+
+        self.assertEqual([i["label"] for i in instances], ["gmab-live", "gmab-old"])
+        pages = sorted(c.kwargs["params"]["page"] for c in mock_get.call_args_list)
+        self.assertEqual(pages, [1, 2])
+        self.assertEqual(mock_get.call_args.kwargs["params"]["per_page"], 50)
+
+    @patch("gmab.providers.hetzner._SESSION.delete")
+    @patch("gmab.providers.hetzner._SESSION.get")
+    def test_listing_is_memoized_and_pruned_on_delete(self, mock_get, mock_delete):
+        mock_get.return_value = mock_response(self._api_payload(), status=200)
+        mock_delete.return_value = mock_response(status=200)
+        provider = make_provider()
+
+        provider.list_instances()
+        self.assertEqual(provider.find_instance_id_by_label("gmab-old"), "2")
+        self.assertEqual(mock_get.call_count, 1)
+
+        provider.terminate_instance("gmab-old")
+        self.assertEqual(mock_delete.call_args[0][0], "https://api.hetzner.cloud/v1/servers/2")
+        self.assertEqual([i["label"] for i in provider.list_instances()], ["gmab-live"])
+        self.assertIsNone(provider.find_instance_id_by_label("gmab-old"))
+        self.assertEqual(mock_get.call_count, 1)
+
+        provider.invalidate_list_cache()
+        provider.list_instances()
+        self.assertEqual(mock_get.call_count, 2)
+
+        provider.list_cache_ttl = 0
+        provider.list_instances()
+        self.assertEqual(mock_get.call_count, 3)
+
 
 class TestHetznerTerminate(unittest.TestCase):
-    @patch("gmab.providers.hetzner.requests.delete")
+    @patch("gmab.providers.hetzner._SESSION.delete")
     def test_terminate_by_numeric_id(self, mock_delete):
         mock_delete.return_value = mock_response(status=200)
         provider = make_provider()
@@ -120,7 +214,7 @@ class TestHetznerTerminate(unittest.TestCase):
         url = mock_delete.call_args[0][0]
         self.assertEqual(url, "https://api.hetzner.cloud/v1/servers/555")
 
-    @patch("gmab.providers.hetzner.requests.delete")
+    @patch("gmab.providers.hetzner._SESSION.delete")
     def test_terminate_by_label_resolves_then_deletes(self, mock_delete):
         mock_delete.return_value = mock_response(status=200)
         provider = make_provider()
@@ -129,6 +223,25 @@ class TestHetznerTerminate(unittest.TestCase):
             finder.assert_called_once_with("gmab-foo")
         self.assertEqual(mock_delete.call_args[0][0], "https://api.hetzner.cloud/v1/servers/888")
 
+    @patch("gmab.providers.hetzner._SESSION.get")
+    @patch("gmab.providers.hetzner._SESSION.delete")
+    def test_bulk_terminate_resolves_labels_with_one_listing(self, mock_delete, mock_get):
+        mock_delete.side_effect = lambda url, **kw: mock_response(
+            status=404 if url.endswith("/3") else 200, text="not found"
+        )
+        mock_get.return_value = mock_response({"servers": [{
+            "id": 888, "name": "gmab-foo", "status": "running", "labels": {},
+            "datacenter": {"location": {"name": "nbg1"}}, "image": {"name": "ubuntu-22.04"},
+        }]})
+        provider = make_provider()
+        errors = provider.terminate_instances(["1", "gmab-foo", "3", "gmab-gone"])
+        mock_get.assert_called_once()
+        deleted = sorted(c[0][0].rsplit("/", 1)[1] for c in mock_delete.call_args_list)
+        self.assertEqual(deleted, ["1", "3", "888"])
+        self.assertEqual(set(errors), {"3", "gmab-gone"})
+        self.assertIn("not found", errors["3"])
+        self.assertIn("No instance found with label 'gmab-gone'", errors["gmab-gone"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,12 @@
+import json
 import time
 import unittest
 from unittest.mock import patch
 
+from gmab.providers import linode
 from gmab.providers.linode import LinodeProvider
 from tests.support.contracts import assert_instance_shape
-from tests.support.http import mock_response
+from tests.support.http import mock_response, sent_json
 
 
 def make_provider():
@@ -18,9 +20,27 @@ def make_provider():
     return p
 
 
+class TestLinodeSession(unittest.TestCase):
+    def test_shared_session_retries_transient_errors(self):
+        retry = linode._SESSION.get_adapter("https://api.linode.com").max_retries
+        self.assertEqual(retry.total, 5)
+        self.assertIn(429, retry.status_forcelist)
+
+    @patch("gmab.providers.linode._SESSION.delete")
+    @patch("gmab.providers.linode._SESSION.get")
+    def test_calls_send_the_same_auth_headers(self, mock_get, mock_delete):
+        mock_get.return_value = mock_response({"data": []}, status=200)
+        mock_delete.return_value = mock_response(status=200)
+        provider = make_provider()
+        provider.list_instances()
+        provider.terminate_instance("1")
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["Authorization"], "Bearer tok")
+        self.assertIs(mock_delete.call_args.kwargs["headers"], provider.headers)
+
+
 class TestLinodeSpawn(unittest.TestCase):
     @patch.object(LinodeProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
-    @patch("gmab.providers.linode.requests.post")
+    @patch("gmab.providers.linode._SESSION.post")
     def test_spawn_builds_payload_and_returns_contract(self, mock_post, _ssh):
         mock_post.return_value = mock_response(
             {"id": 123, "ipv4": ["1.2.3.4"], "status": "provisioning"}, status=200
@@ -34,7 +54,7 @@ class TestLinodeSpawn(unittest.TestCase):
         # Correct endpoint + payload shape
         args, kwargs = mock_post.call_args
         self.assertEqual(args[0], "https://api.linode.com/v4/linode/instances")
-        payload = kwargs["json"]
+        payload = sent_json(mock_post.call_args)
         self.assertEqual(payload["type"], "g6-nanode-1")
         self.assertEqual(payload["region"], "nl-ams")
         self.assertEqual(payload["authorized_keys"], ["ssh-ed25519 AAAA"])
@@ -49,6 +69,21 @@ class TestLinodeSpawn(unittest.TestCase):
         self.assertEqual(result["ip"], "1.2.3.4")
         self.assertEqual(result["lifetime_minutes"], 30)
 
+    @patch.object(LinodeProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
+    @patch("gmab.providers.linode._SESSION.post")
+    def test_spawn_overrides_leave_the_body_template_alone(self, mock_post, _ssh):
+        mock_post.return_value = mock_response({"id": 1, "ipv4": [], "status": "provisioning"})
+        provider = make_provider()
+
+        provider.spawn_instance(image="linode/debian12", region="us-east")
+        provider.spawn_instance()
+
+        first, second = (sent_json(c) for c in mock_post.call_args_list)
+        self.assertEqual((first["image"], first["region"]), ("linode/debian12", "us-east"))
+        self.assertEqual((second["image"], second["region"]), ("linode/ubuntu22.04", "nl-ams"))
+        self.assertEqual(second["root_pass"], "ChangeMe123!")
+        self.assertNotIn("label", provider._instance_body_template)
+
     def test_spawn_without_api_key_raises(self):
         provider = LinodeProvider({})
         provider.provider_name = "linode"
@@ -56,7 +91,7 @@ class TestLinodeSpawn(unittest.TestCase):
             provider.spawn_instance()
 
     @patch.object(LinodeProvider, "_read_ssh_key", return_value="ssh-ed25519 AAAA")
-    @patch("gmab.providers.linode.requests.post")
+    @patch("gmab.providers.linode._SESSION.post")
     def test_spawn_api_error_raises(self, mock_post, _ssh):
         mock_post.return_value = mock_response(status=400, text="bad request")
         provider = make_provider()
@@ -87,7 +122,7 @@ class TestLinodeList(unittest.TestCase):
             ]
         }
 
-    @patch("gmab.providers.linode.requests.get")
+    @patch("gmab.providers.linode._SESSION.get")
     def test_list_filters_and_computes_expiry(self, mock_get):
         mock_get.return_value = mock_response(self._api_payload(), status=200)
         provider = make_provider()
@@ -102,16 +137,78 @@ class TestLinodeList(unittest.TestCase):
         for inst in instances:
             assert_instance_shape(self, inst)
 
-    @patch("gmab.providers.linode.requests.get")
+        kwargs = mock_get.call_args.kwargs
+        self.assertEqual(json.loads(kwargs["headers"]["X-Filter"]), {"tags": "gmab"})
+        self.assertEqual(kwargs["params"]["page_size"], 500)
+
+    @patch("gmab.providers.linode._SESSION.get")
+    def test_list_fetches_every_page(self, mock_get):
+        data = self._api_payload()["data"]
+        def page(url, params, **kw):
+            body = {"data": [data[params["page"] - 1]], "page": params["page"], "pages": 2}
+            return mock_response(body, status=200)
+        mock_get.side_effect = page
+
+        instances = make_provider().list_instances()
+
+        self.assertEqual([i["label"] for i in instances], ["gmab-live", "gmab-old"])
+        pages = sorted(c.kwargs["params"]["page"] for c in mock_get.call_args_list)
+        self.assertEqual(pages, [1, 2])
+
+    @patch("gmab.providers.linode._SESSION.get")
     def test_list_expired_filters(self, mock_get):
         mock_get.return_value = mock_response(self._api_payload(), status=200)
         provider = make_provider()
         expired = provider.list_expired_instances()
         self.assertEqual([i["label"] for i in expired], ["gmab-old"])
 
+    @patch("gmab.providers.linode._SESSION.delete")
+    @patch("gmab.providers.linode._SESSION.get")
+    def test_listing_is_memoized_and_pruned_on_delete(self, mock_get, mock_delete):
+        mock_get.return_value = mock_response(self._api_payload(), status=200)
+        mock_delete.return_value = mock_response(status=200)
+        provider = make_provider()
+
+        provider.list_instances()
+        self.assertEqual(provider.find_instance_id_by_label("gmab-old"), "2")
+        provider.list_expired_instances()
+        self.assertEqual(mock_get.call_count, 1)
+
+        provider.terminate_instance("gmab-old")
+        self.assertEqual(mock_delete.call_args[0][0], "https://api.linode.com/v4/linode/instances/2")
+        self.assertEqual([i["label"] for i in provider.list_instances()], ["gmab-live"])
+        self.assertIsNone(provider.find_instance_id_by_label("gmab-old"))
+        self.assertEqual(mock_get.call_count, 1)
+
+        provider.invalidate_list_cache()
+        provider.list_instances()
+        self.assertEqual(mock_get.call_count, 2)
+
+        provider.list_cache_ttl = 0
+        provider.list_instances()
+        self.assertEqual(mock_get.call_count, 3)
+
+
+class TestLinodeExpiryTags(unittest.TestCase):
+    def test_reads_expiry_tags_and_ignores_the_rest(self):
+        tags = ["gmab", "team-x", "gmab-lifetime-30", "gmab-creation-time-1700000000",
+                "gmab-lifetime-soon"]
+        creation_time, lifetime, _ = make_provider()._get_instance_expiry_info(tags)
+        self.assertEqual((creation_time, lifetime), (1700000000, 30))
+
+    def test_expiry_is_judged_against_the_given_time(self):
+        tags = ["gmab", "gmab-creation-time-1000", "gmab-lifetime-10"]
+        provider = make_provider()
+        self.assertFalse(provider._get_instance_expiry_info(tags, now=1000 + 600)[2])
+        self.assertTrue(provider._get_instance_expiry_info(tags, now=1000 + 601)[2])
+
+    def test_defaults_without_expiry_tags(self):
+        creation_time, lifetime, _ = make_provider()._get_instance_expiry_info(["gmab"])
+        self.assertEqual((creation_time, lifetime), (0, 60))
+
 
 class TestLinodeTerminate(unittest.TestCase):
-    @patch("gmab.providers.linode.requests.delete")
+    @patch("gmab.providers.linode._SESSION.delete")
     def test_terminate_by_numeric_id(self, mock_delete):
         mock_delete.return_value = mock_response(status=200)
         provider = make_provider()
@@ -121,7 +218,7 @@ class TestLinodeTerminate(unittest.TestCase):
         url = mock_delete.call_args[0][0]
         self.assertEqual(url, "https://api.linode.com/v4/linode/instances/123")
 
-    @patch("gmab.providers.linode.requests.delete")
+    @patch("gmab.providers.linode._SESSION.delete")
     def test_terminate_by_label_resolves_then_deletes(self, mock_delete):
         mock_delete.return_value = mock_response(status=204)
         provider = make_provider()
@@ -131,13 +228,45 @@ class TestLinodeTerminate(unittest.TestCase):
         url = mock_delete.call_args[0][0]
         self.assertEqual(url, "https://api.linode.com/v4/linode/instances/999")
 
-    @patch("gmab.providers.linode.requests.delete")
+    @patch("gmab.providers.linode._SESSION.delete")
+    @patch("gmab.providers.linode._SESSION.get")
+    def test_terminate_by_label_queries_just_that_label(self, mock_get, mock_delete):
+        mock_get.return_value = mock_response({"data": [{"id": 999, "label": "gmab-foo"}]})
+        mock_delete.return_value = mock_response(status=200)
+        make_provider().terminate_instance("gmab-foo")
+        x_filter = json.loads(mock_get.call_args.kwargs["headers"]["X-Filter"])
+        self.assertEqual(x_filter, {"label": "gmab-foo", "tags": "gmab"})
+        self.assertEqual(mock_delete.call_args[0][0], "https://api.linode.com/v4/linode/instances/999")
+
+    @patch("gmab.providers.linode._SESSION.get")
+    def test_filtered_lookup_of_unknown_label_is_none(self, mock_get):
+        mock_get.return_value = mock_response({"data": []})
+        self.assertIsNone(make_provider().find_instance_id_by_label("gmab-missing"))
+
+    @patch("gmab.providers.linode._SESSION.delete")
     def test_terminate_unknown_label_raises(self, mock_delete):
         provider = make_provider()
         with patch.object(provider, "find_instance_id_by_label", return_value=None):
             with self.assertRaises(Exception):
                 provider.terminate_instance("gmab-missing")
 
+    @patch("gmab.providers.linode._SESSION.get")
+    @patch("gmab.providers.linode._SESSION.delete")
+    def test_bulk_terminate_resolves_labels_with_one_listing(self, mock_delete, mock_get):
+        mock_delete.side_effect = lambda url, **kw: mock_response(
+            status=404 if url.endswith("/3") else 200, text="not found"
+        )
+        mock_get.return_value = mock_response({"data": [{
+            "id": 999, "label": "gmab-foo", "ipv4": [], "status": "running", "tags": ["gmab"],
+        }]})
+        provider = make_provider()
+        errors = provider.terminate_instances(["1", "gmab-foo", "3", "gmab-gone"])
+        mock_get.assert_called_once()
+        deleted = sorted(c[0][0].rsplit("/", 1)[1] for c in mock_delete.call_args_list)
+        self.assertEqual(deleted, ["1", "3", "999"])
+        self.assertEqual(set(errors), {"3", "gmab-gone"})
+        self.assertIn("not found", errors["3"])
+
 
 if __name__ == "__main__":
     unittest.main()
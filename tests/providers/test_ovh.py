@@ -1,5 +1,6 @@
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, Mock
 
 from gmab.providers.ovh import OVHProvider
@@ -114,6 +115,17 @@ class TestOVHSshKey(unittest.TestCase):
         self.assertEqual(key_id, "key-new")
         provider.client.post.assert_called_once()
 
+    def test_concurrent_spawns_upload_the_key_once(self):
+        provider = make_provider()
+        provider.client.get.return_value = []
+        provider.client.post.return_value = {"id": "key-new"}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ids = list(pool.map(
+                lambda _: provider._get_or_create_ssh_key("GRA9", "ssh-ed25519 NEW"), range(4)
+            ))
+        self.assertEqual(ids, ["key-new"] * 4)
+        provider.client.post.assert_called_once()
+
 
 class TestOVHList(unittest.TestCase):
     def _instances(self):
@@ -1,9 +1,13 @@
+import subprocess
+import sys
 import unittest
 
 from gmab.providers import (
     get_registry,
     get_available_providers,
     get_provider,
+    get_provider_class,
+    get_identifier_owner,
     AWSProvider,
     LinodeProvider,
     HetznerProvider,
@@ -23,11 +27,50 @@ class TestRegistry(unittest.TestCase):
         self.assertIs(registry["aws"], AWSProvider)
         self.assertIs(registry["hetzner"], HetznerProvider)
 
+    def test_identifier_owner_by_prefix(self):
+        self.assertEqual(get_identifier_owner("i-0abc"), "aws")
+        self.assertIsNone(get_identifier_owner("gmab-foo"))
+        self.assertIsNone(get_identifier_owner("12345"))
+        self.assertIsNone(get_identifier_owner(""))
+
+    def test_identifier_owner_only_considers_given_providers(self):
+        self.assertEqual(get_identifier_owner("i-0abc", ["linode", "aws"]), "aws")
+        self.assertIsNone(get_identifier_owner("i-0abc", ["linode", "hetzner"]))
+
+    def test_shipped_id_prefixes_mirror_the_classes(self):
+        from gmab.providers.registry import _SHIPPED_ID_PREFIXES
+        registry = get_registry()
+        for name, prefixes in _SHIPPED_ID_PREFIXES.items():
+            self.assertEqual(tuple(registry[name].ID_PREFIXES), prefixes, name)
+
+    def test_identifier_owner_does_not_load_provider_sdks(self):
+        code = (
+            "import sys, gmab.providers as p; "
+            "assert p.get_identifier_owner('i-0abc', ['aws', 'ovh', 'linode']) == 'aws'; "
+            "assert 'boto3' not in sys.modules and 'ovh' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_package_import_does_not_load_provider_sdks(self):
+        # Fresh interpreter: this test process has long since imported boto3.
+        code = (
+            "import sys, gmab.providers as p; "
+            "p.get_provider('linode', {'api_key': 'x'}); "
+            "assert 'boto3' not in sys.modules and 'ovh' not in sys.modules; "
+            "assert p.AWSProvider.name == 'aws'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_template_is_not_registered(self):
         # The underscore-prefixed reference template must never register.
         self.assertNotIn(None, get_registry())
         self.assertNotIn("template", get_registry())
 
+    def test_get_provider_class_resolves_by_name(self):
+        self.assertIs(get_provider_class("aws"), AWSProvider)
+        self.assertIsNone(get_provider_class("nope"))
+        self.assertIsNone(get_provider_class("registry"))
+
     def test_get_provider_unknown_raises(self):
         with self.assertRaises(ValueError):
             get_provider("nope", {"api_key": "x"})
@@ -36,6 +79,11 @@ class TestRegistry(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_provider("linode", {})
 
+    def test_get_provider_reuses_instance_for_same_config(self):
+        first = get_provider("linode", {"api_key": "reuse"})
+        self.assertIs(get_provider("linode", {"api_key": "reuse"}), first)
+        self.assertIsNot(get_provider("linode", {"api_key": "other"}), first)
+
     def test_get_provider_sets_provider_name(self):
         provider = get_provider("linode", {"api_key": "x"})
         self.assertEqual(provider.provider_name, "linode")
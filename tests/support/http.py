@@ -1,12 +1,22 @@
 """Helpers for mocking the `requests` library in provider tests."""
 
+import json
 from unittest.mock import MagicMock
 
 
 def mock_response(json_data=None, status=200, text=""):
-    """Build a fake requests.Response with .status_code / .json() / .text."""
+    """Build a fake requests.Response with .status_code / .json() / .content / .text."""
     resp = MagicMock()
     resp.status_code = status
     resp.json.return_value = json_data if json_data is not None else {}
+    resp.content = json.dumps(resp.json.return_value).encode("utf-8")
     resp.text = text
     return resp
+
+
+def sent_json(call):
+    """The JSON body of a mocked session call, whether sent as json= or data=."""
+    kwargs = call.kwargs
+    if "json" in kwargs:
+        return kwargs["json"]
+    return json.loads(kwargs["data"])
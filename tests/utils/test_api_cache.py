@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from gmab.utils.api_cache import cache_get, cache_put, cache_invalidate, clear_cache
+from gmab.utils.instance_index import save_instance_index, lookup_instance
+from tests.support.config_env import ConfigDirTestCase
+from tests.support.fakes import make_instance
+
+
+class TestApiCache(ConfigDirTestCase):
+    def test_roundtrip_and_ttl(self):
+        cache_put("aws", "vpc", "vpc-1")
+        self.assertEqual(cache_get("aws", "vpc", ttl=60), "vpc-1")
+        self.assertIsNone(cache_get("aws", "vpc", ttl=-1))
+        self.assertIsNone(cache_get("aws", "missing", ttl=60))
+        self.assertIsNone(cache_get("other", "vpc", ttl=60))
+
+    def test_invalidate_drops_only_that_key(self):
+        cache_put("aws", "a", [1])
+        cache_put("aws", "b", [2])
+        cache_invalidate("aws", "a")
+        self.assertIsNone(cache_get("aws", "a", ttl=60))
+        self.assertEqual(cache_get("aws", "b", ttl=60), [2])
+
+    def test_concurrent_puts_keep_every_entry(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: cache_put("aws", f"k{i}", i), range(32)))
+        for i in range(32):
+            self.assertEqual(cache_get("aws", f"k{i}", 60), i)
+        leftovers = [n for n in os.listdir(os.path.join(self.config_dir, "cache")) if n.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_corrupt_file_is_a_miss(self):
+        cache_put("aws", "a", 1)
+        with open(os.path.join(self.config_dir, "cache", "aws.json"), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(cache_get("aws", "a", ttl=60))
+
+    def test_clear_removes_everything_including_index(self):
+        self.assertEqual(clear_cache(), 0)
+        cache_put("aws", "a", 1)
+        save_instance_index([make_instance(provider="linode", instance_id="42", label="gmab-abc")])
+        self.assertEqual(clear_cache(), 2)
+        self.assertIsNone(cache_get("aws", "a", ttl=60))
+        self.assertIsNone(lookup_instance("42"))
@@ -1,4 +1,5 @@
 import os
+from unittest.mock import patch
 
 from gmab.utils.config_loader import (
     load_config,
@@ -26,6 +27,30 @@ class TestConfigLoader(ConfigDirTestCase):
         save_config(cfg, "config.json")
         self.assertEqual(load_config("config.json"), cfg)
 
+    def test_repeated_loads_read_the_file_once(self):
+        save_config({"default_provider": "linode"}, "config.json")
+        with patch("builtins.open", wraps=open) as opened:
+            load_config("config.json")
+            load_config("config.json")
+        self.assertEqual(opened.call_count, 1)
+
+    def test_cached_config_is_not_shared_with_callers(self):
+        save_config({"default_provider": "linode"}, "config.json")
+        load_config("config.json")["default_provider"] = "aws"
+        self.assertEqual(load_config("config.json")["default_provider"], "linode")
+
+    def test_save_invalidates_cache(self):
+        save_config({"default_provider": "linode"}, "config.json")
+        load_config("config.json")
+        save_config({"default_provider": "aws"}, "config.json")
+        self.assertEqual(load_config("config.json")["default_provider"], "aws")
+
+    def test_roundtrip_without_orjson(self):
+        cfg = {"ssh_key_path": "k", "default_lifetime_minutes": 42}
+        with patch("gmab.utils.config_loader.orjson", None):
+            save_config(cfg, "config.json")
+            self.assertEqual(load_config("config.json"), cfg)
+
 
 class TestDefaultProvidersConfig(ConfigDirTestCase):
     def test_keys_match_registry(self):
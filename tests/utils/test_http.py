@@ -0,0 +1,84 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests.adapters import HTTPAdapter
+
+from gmab.utils import http
+from gmab.utils.http import new_session, default_retry, decode_json, encode_json, POOL_SIZE
+from tests.support.http import mock_response
+
+
+def mock_status(status, headers=None):
+    """A urllib3-style response stub: just what Retry inspects."""
+    response = MagicMock(status=status)
+    response.headers = headers or {}
+    response.get_redirect_location.return_value = False
+    return response
+
+
+class TestNewSession(unittest.TestCase):
+    def test_mounts_pooled_https_adapter(self):
+        adapter = new_session().get_adapter("https://api.example.com")
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_maxsize, POOL_SIZE)
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    def test_retry_policy_is_mounted(self):
+        adapter = new_session(retry=default_retry()).get_adapter("https://api.example.com")
+        retry = adapter.max_retries
+        self.assertEqual(retry.total, 5)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertFalse(retry.raise_on_status)
+
+    def test_post_is_not_replayed_after_a_server_error(self):
+        retry = default_retry()
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertTrue(retry.is_retry("DELETE", 429))
+        self.assertFalse(retry.is_retry("POST", 502))
+
+    def test_rate_limited_post_is_retried(self):
+        self.assertTrue(default_retry().is_retry("POST", 429))
+
+
+class TestRetryDeadline(unittest.TestCase):
+    def _fail_once(self, retry):
+        return retry.increment(method="GET", url="/servers", response=mock_status(503))
+
+    def test_deadline_starts_at_first_failure_and_carries_over(self):
+        with patch.object(http.time, "monotonic", return_value=100.0):
+            retry = self._fail_once(default_retry())
+            self.assertEqual(retry.deadline, 100.0 + http.RETRY_DEADLINE)
+            self.assertEqual(self._fail_once(retry).deadline, retry.deadline)
+        self.assertIsNone(default_retry().deadline)
+
+    def test_gives_up_and_clips_waits_once_the_deadline_nears(self):
+        with patch.object(http.time, "monotonic", return_value=0.0):
+            retry = self._fail_once(default_retry())
+        with patch.object(http.time, "monotonic", return_value=http.RETRY_DEADLINE - 1):
+            self.assertFalse(retry.is_exhausted())
+            self.assertLessEqual(retry.get_backoff_time(), 1.0)
+            self.assertEqual(retry.get_retry_after(mock_status(429, {"Retry-After": "60"})), 1.0)
+        with patch.object(http.time, "monotonic", return_value=http.RETRY_DEADLINE):
+            self.assertTrue(retry.is_exhausted())
+
+    def test_backoff_is_capped(self):
+        retry = default_retry()
+        for _ in range(5):  # uncapped, the fifth wait would be 8s
+            retry = self._fail_once(retry)
+        self.assertLessEqual(retry.get_backoff_time(), http.RETRY_BACKOFF_CAP)
+
+
+class TestJsonHelpers(unittest.TestCase):
+    def test_roundtrip_with_and_without_orjson(self):
+        payload = {"name": "gmab-x", "ssh_keys": [1], "labels": {"gmab": "true"}}
+        for backend in (http.orjson, None):
+            with patch.object(http, "orjson", backend):
+                body = encode_json(payload)
+                self.assertIsInstance(body, bytes)
+                self.assertEqual(json.loads(body), payload)
+                self.assertEqual(decode_json(mock_response(payload)), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from gmab.utils import instance_index
+from gmab.utils.instance_index import (
+    save_instance_index,
+    lookup_instance,
+    invalidate_instance_index,
+)
+from tests.support.config_env import ConfigDirTestCase
+from tests.support.fakes import make_instance
+
+
+class TestInstanceIndex(ConfigDirTestCase):
+    def setUp(self):
+        super().setUp()
+        save_instance_index([make_instance(provider="linode", instance_id="42", label="gmab-abc")])
+
+    def test_lookup_by_id_and_label(self):
+        self.assertEqual(lookup_instance("42"), ("linode", "42"))
+        self.assertEqual(lookup_instance("gmab-abc"), ("linode", "42"))
+        self.assertIsNone(lookup_instance("gmab-zzz"))
+
+    def test_expired_index_is_ignored(self):
+        with patch.object(instance_index, "INDEX_TTL_SECONDS", -1):
+            self.assertIsNone(lookup_instance("gmab-abc"))
+
+    def test_invalidate_removes_index(self):
+        invalidate_instance_index()
+        self.assertIsNone(lookup_instance("gmab-abc"))
+        invalidate_instance_index()  # idempotent
+
+    def test_id_shared_across_providers_is_ambiguous(self):
+        save_instance_index([
+            make_instance(provider="linode", instance_id="42", label="gmab-abc"),
+            make_instance(provider="hetzner", instance_id="42", label="gmab-def"),
+        ])
+        self.assertIsNone(lookup_instance("42"))
+        self.assertEqual(lookup_instance("gmab-abc"), ("linode", "42"))
+        self.assertEqual(lookup_instance("gmab-def"), ("hetzner", "42"))
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from gmab.utils.paths import get_config_dir, get_config_file_path
 from tests.support.config_env import ConfigDirTestCase
@@ -10,6 +11,11 @@ class TestPaths(ConfigDirTestCase):
         self.assertEqual(get_config_dir(), Path(os.environ["GMAB_CONFIG_DIR"]))
         self.assertEqual(get_config_dir(), Path(self.config_dir))
 
+    def test_resolution_follows_env_changes(self):
+        with patch.dict(os.environ, {"GMAB_CONFIG_DIR": "/tmp/gmab-other"}):
+            self.assertEqual(get_config_dir(), Path("/tmp/gmab-other"))
+        self.assertEqual(get_config_dir(), Path(self.config_dir))
+
     def test_get_config_file_path_joins_filename(self):
         self.assertEqual(
             get_config_file_path("providers.json"),